@@ -12,10 +12,16 @@
 
 import random
 import os
+import math
+import itertools
+import json
+import csv
+import tempfile
 import numpy as np
 from scipy.optimize import curve_fit
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
 from matplotlib.figure import Figure
+from matplotlib import colormaps
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QMessageBox,
     QLabel, QLineEdit, QComboBox, QCheckBox, QPushButton, QFileDialog, QTextEdit, QDialog, QSizePolicy
@@ -25,6 +31,12 @@ from PyQt6.QtGui import QPalette, QColor, QFont
 import sys
 import pickle
 
+# numba is optional. When it is installed the point by point loops are compiled, otherwise they run in Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Class which will store the "graph style", which is all of the 
 # data defining a graph except its data and data types
 class GraphStyle:
@@ -50,8 +62,8 @@ class GraphStyle:
         self.marker_style = marker_style
         self.line_name = line_name
 
-# Class which will store all characteristic data of a graph, which can then be pickled into a 
-# bytestream and stored for later graphing
+# Class which will store all characteristic data of a graph, which can then be written into a
+# .MRGO file and stored for later graphing
 class GraphObject:
     def __init__(self, plot_type, graph_style: GraphStyle, x_data, x_dataType, y_data, y_dataType, z_data, z_dataType, names, plot_title):
         self.plot_type = plot_type
@@ -65,6 +77,39 @@ class GraphObject:
         self.names = names
         self.plot_title = plot_title
 
+    # Function which gives everything the conditioned data of this graph depends on, so graphs with equal
+    # signatures can share the output of clean_data_2D/clean_data_3D. The columns are compared by identity,
+    # and the data types by value as saving the axis settings changes them in place
+    def data_signature(self):
+        data_types = tuple(tuple(getattr(data_type, field) for field in DataType.__slots__)
+                           for data_type in (self.x_dataType, self.y_dataType, self.z_dataType))
+        return (self.plot_type, self.graph_style.remove_out_of_range_data, id(self.x_data), id(self.y_data), id(self.z_data), data_types)
+
+    # Function which writes the graph into an open .MRGO file as a numpy archive. The three data
+    # columns are stored as float arrays and everything else as a JSON string, so nothing is pickled
+    def save(self, file):
+        data_types = [[data_type.index, data_type.unit, data_type.conv, data_type.precision, data_type.range_low,
+                       data_type.range_high, data_type.max_step, data_type.start_pos]
+                      for data_type in (self.x_dataType, self.y_dataType, self.z_dataType)]
+        meta = {"plot_type": self.plot_type, "graph_style": vars(self.graph_style), "data_types": data_types,
+                "names": self.names, "plot_title": self.plot_title}
+        np.savez_compressed(file, meta=np.array(json.dumps(meta)), x=to_float_array(self.x_data),
+                            y=to_float_array(self.y_data), z=to_float_array(self.z_data))
+
+    # Function which reads a graph back from a .MRGO file. Files saved before the numpy archive was
+    # used are pickled GraphObjects, and are still loaded as such
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as file:
+            if file.read(2) != b'PK':
+                file.seek(0)
+                return pickle.load(file)
+        with np.load(path) as archive:
+            meta = json.loads(str(archive["meta"]))
+            x_dataType, y_dataType, z_dataType = [DataType(*fields) for fields in meta["data_types"]]
+            return GraphObject(meta["plot_type"], GraphStyle(**meta["graph_style"]), archive["x"], x_dataType, archive["y"],
+                               y_dataType, archive["z"], z_dataType, meta["names"], meta["plot_title"])
+
 # Function to calculate moving averages, used for trend lines. 
 # Should be updated in the future to be padded on edges 
 def movingaverage(interval, window_size):
@@ -75,78 +120,218 @@ def movingaverage(interval, window_size):
 def logarithm(x, a, b):
     return a * np.log(x) + b
 
+# Function which picks the points of a series to plot using the Largest-Triangle-Three-Buckets
+# algorithm. The series is split into n_out buckets and the point making the largest triangle with
+# the previously picked point and the next bucket's average is kept from each, which preserves the
+# visual shape of the series. Returns the indices of the kept points, or of every point when the
+# series is small enough to plot directly
+def lttb_indices(x_vals, y_vals, n_out):
+    n = len(x_vals)
+    if n < 4 * n_out or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x_vals, dtype=np.float64)
+    y = np.asarray(y_vals, dtype=np.float64)
+    edges = (np.arange(n_out - 1) * (n - 2)) // (n_out - 2) + 1
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        indices[i + 1] = a
+    return indices
+
+# Function which returns how many points are worth plotting across the width of a figure
+def plot_resolution(figure):
+    return 2 * int(figure.get_size_inches()[0] * figure.dpi)
+
+# Number of points above which a 3D scatter is binned, and the number of bins along each axis
+SAMPLING_THRESHOLD = 50000
+SAMPLING_BINS = 100
+
+# Function which merges the points of a 3D scatter that fall into the same voxel of a bins x bins x bins
+# grid over the data. Returns the index of the first point in each voxel and how many points it holds
+def bin_points_3D(x_vals, y_vals, z_vals, bins):
+    keys = np.zeros(len(x_vals), dtype=np.int64)
+    for vals in (x_vals, y_vals, z_vals):
+        low = vals.min()
+        span = vals.max() - low
+        if span == 0: span = 1
+        cell = np.minimum(((vals - low) / span * bins).astype(np.int64), bins - 1)
+        keys = keys * bins + cell
+    _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    return first, counts
+
+# Function which picks the points of a 3D scatter to draw and their marker sizes. Large logs are binned
+# first, with each kept point sized by how many points it stands for
+def sample_points_3D(x_vals, y_vals, z_vals, marker_size):
+    if len(x_vals) <= SAMPLING_THRESHOLD:
+        return x_vals, y_vals, z_vals, marker_size
+    shown, counts = bin_points_3D(x_vals, y_vals, z_vals, SAMPLING_BINS)
+    return x_vals[shown], y_vals[shown], z_vals[shown], marker_size * np.sqrt(counts)
+
+# Function which converts a column of graph data into a float array. Values which are not
+# numbers (such as a text column) become NaN
+def to_float_array(vals):
+    try:
+        return np.array(vals, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([val if isinstance(val, (int, float)) else np.nan for val in vals], dtype=np.float64)
+
+# Function which removes the rows where any of the columns is NaN, so that a missing value is never
+# held or stepped from while conditioning. Returns the columns in the same order
+def drop_invalid_rows(*columns):
+    valid = ~np.isnan(columns[0])
+    for column in columns[1:]:
+        valid &= ~np.isnan(column)
+    if valid.all():
+        return columns
+    return tuple(column[valid] for column in columns)
+
+# Function which returns which values of a column are inside the range of its data type once converted
+def in_range(vals, dataType):
+    scale = dataType.scale
+    scaled = vals * scale if scale != 1 else vals
+    return ~((scaled < dataType.range_low) | (scaled > dataType.range_high))
+
+# Function which walks a column from start, keeping a value only when it is in range and within max_step
+# of the value kept before it, otherwise the kept value is held. Everything before start must be final.
+# Written to work on both lists and arrays so it can be compiled by numba. The checks are folded into
+# one mask and a select rather than nested ifs, so the compiled loop does not branch on the data
+def hold_steps_loop(values, kept, max_step, start, held):
+    prev = held[start - 1]
+    for i in range(start, len(values)):
+        value = values[i]
+        rejected = (not kept[i]) | (abs(value - prev) > max_step)
+        prev = prev if rejected else value
+        held[i] = prev
+    return held
+
+# The loop runs on the graph worker thread, so the GIL is released to keep the GUI thread responsive
+if njit is not None:
+    hold_steps_loop = njit(nogil=True)(hold_steps_loop)
+
+# Function which compiles hold_steps_loop for the argument types hold_steps uses, with a two point
+# column, so that the first graph with a max step is not held up by numba
+def warm_up_hold_steps():
+    if njit is not None:
+        hold_steps_loop(np.zeros(2), np.ones(2, dtype=bool), 1.0, 1, np.zeros(2))
+    return True
+
+# Function which runs hold_steps_loop on a column, compiled when numba is installed. Plain Python is
+# fastest over lists rather than arrays, so the column is converted for it
+def hold_steps(conditioned, kept, max_step, start, held):
+    if njit is not None:
+        return hold_steps_loop(conditioned, kept, float(max_step), int(start), held)
+    return np.array(hold_steps_loop(conditioned.tolist(), kept.tolist(), max_step, start, held.tolist()), dtype=np.float64)
+
+# Function which applies the conversion, range, and max step of a data type to a column of graph data.
+# A value out of range, or further than max_step from the value kept before it, is replaced by that kept
+# value. The first value is only converted when scale_first is set (the remove out of range path),
+# otherwise it is swapped for start_pos when out of range. vals is converted in place, and not at all
+# when the conversion is 1, which saves a full copy of the column for most headers
+def condition_column(vals, dataType, scale_first):
+    if len(vals) == 0:
+        return vals
+    first = vals[0]
+    scale = dataType.scale
+    if scale != 1:
+        vals *= scale
+    conditioned = vals
+    if not scale_first:
+        conditioned[0] = first
+        if (first < dataType.range_low or first > dataType.range_high) and dataType.start_pos is not None:
+            conditioned[0] = dataType.start_pos
+
+    # Holding the last in range value is a forward fill, done with a running max over the kept positions
+    kept = ~((conditioned < dataType.range_low) | (conditioned > dataType.range_high))
+    kept[0] = True
+    sources = np.where(kept, np.arange(len(conditioned)), 0)
+    np.maximum.accumulate(sources, out=sources)
+    held = conditioned[sources]
+
+    # The max step depends on the previously kept value, so it is only walked point by point from the
+    # first step that is too large. Before that the forward fill is already the answer
+    if dataType.max_step < math.inf:
+        jumps = np.flatnonzero(np.abs(np.diff(held)) > dataType.max_step)
+        if len(jumps):
+            held = hold_steps(conditioned, kept, dataType.max_step, jumps[0] + 1, held)
+    return held
+
+# Function which applies the conversions, ranges, and max steps of the data types to columns of graph
+# data, shared by the 2D and 3D graphs. Rows with a missing value in any column are dropped first. When
+# removing out of range data only the ranges of the first "checked" columns decide which rows are kept.
+# Returns the columns ready for plotting
+def clean_columns(columns, data_types, checked, remove_out_of_range):
+    columns = drop_invalid_rows(*[to_float_array(column) for column in columns])
+
+    if remove_out_of_range:
+        keep = in_range(columns[0], data_types[0])
+        for column, data_type in zip(columns[1:checked], data_types[1:checked]):
+            keep &= in_range(column, data_type)
+        columns = [column[keep] for column in columns]
+
+    return tuple(condition_column(column, data_type, remove_out_of_range) for column, data_type in zip(columns, data_types))
+
+# Function which applies the conversions, ranges, and max steps of the data types to the data of a
+# 2 dimensional graph object. Returns the x and y values ready for plotting
+def clean_data_2D(graph_object: GraphObject):
+    return clean_columns((graph_object.x_data, graph_object.y_data), (graph_object.x_dataType, graph_object.y_dataType),
+                         2, graph_object.graph_style.remove_out_of_range_data)
+
+# Function which applies the conversions, ranges, and max steps of the data types to the data of a
+# 3 dimensional graph object. When removing out of range data the z range is only checked if
+# check_z_range is set, as a color axis is shown in full. Returns the x, y, and z values ready for plotting
+def clean_data_3D(graph_object: GraphObject, check_z_range):
+    return clean_columns((graph_object.x_data, graph_object.y_data, graph_object.z_data),
+                         (graph_object.x_dataType, graph_object.y_dataType, graph_object.z_dataType),
+                         3 if check_z_range else 2, graph_object.graph_style.remove_out_of_range_data)
+
+# Function which gives the axis label for a column, which is its name followed by its unit if known
+def axis_label(name, data_type):
+    if data_type.unit == "unknown":
+        return name
+    return name + " (" + data_type.unit + ")"
+
+# Function which sets the title and axis labels of an existing plot from a graph object, used when
+# a plot is updated in place for a different selection of columns
+def update_plot_labels(plot, graph_object: GraphObject):
+    names = graph_object.names
+    plot.set_title(graph_object.plot_title)
+    plot.set_xlabel(axis_label(names[0], graph_object.x_dataType))
+    plot.set_ylabel(axis_label(names[1], graph_object.y_dataType))
+    if hasattr(plot, "set_zlabel"):
+        plot.set_zlabel(axis_label(names[2], graph_object.z_dataType))
+
 # Function which makes a 2 dimensional plot from a graph object. 
-# This can be from the main window, as a breakout window, or as a saved graph
-def make_plot_2D(figure, graph_object: GraphObject):
-    x_dataType = graph_object.x_dataType
-    y_dataType = graph_object.y_dataType
-
-    x_vals = graph_object.x_data.copy()
-    y_vals = graph_object.y_data.copy()
-
-    if graph_object.graph_style.remove_out_of_range_data:
-        i = 0
-        while i < len(x_vals):
-            x_val = x_vals[i] * (x_dataType.conv / x_dataType.precision)
-            y_val = y_vals[i] * (y_dataType.conv / y_dataType.precision)
-            if x_val < x_dataType.range_low or x_val > x_dataType.range_high or y_val < y_dataType.range_low or y_val > y_dataType.range_high:
-                del x_vals[i]
-                del y_vals[i]
-            else:
-                i += 1
-        x_vals[0] *= x_dataType.conv / x_dataType.precision
-        y_vals[0] *= y_dataType.conv / y_dataType.precision
-    else:
-        if x_dataType.range_low is not None:
-            if (x_vals[0] < x_dataType.range_low or x_vals[0] > x_dataType.range_high) and x_dataType.start_pos is not None:
-                x_vals[0] = x_dataType.start_pos
-
-        if y_dataType.range_low is not None:
-            if (y_vals[0] < y_dataType.range_low or y_vals[0] > y_dataType.range_high) and y_dataType.start_pos is not None:
-                y_vals[0] = y_dataType.start_pos
-
-    i = 1
-    while i < len(y_vals):
-        try:
-            x_vals[i] *= x_dataType.conv / x_dataType.precision
-            y_vals[i] *= y_dataType.conv / y_dataType.precision
-            if x_dataType.range_low is not None:
-                if x_vals[i] < x_dataType.range_low or x_vals[i] > x_dataType.range_high:
-                    x_vals[i] = x_vals[i-1]
-
-            if y_dataType.range_low is not None:
-                if y_vals[i] < y_dataType.range_low or y_vals[i] > y_dataType.range_high:
-                    y_vals[i] = y_vals[i-1]
-
-            if x_dataType.max_step is not None:
-                if abs(x_vals[i] - x_vals[i-1]) > x_dataType.max_step:
-                    x_vals[i] = x_vals[i-1]
-                    
-            if y_dataType.max_step is not None:
-                if abs(y_vals[i] - y_vals[i-1]) > y_dataType.max_step:
-                    y_vals[i] = y_vals[i-1]
-
-        except TypeError:
-            print("type error")
-            print(i)
-        i += 1
-
-    if x_dataType.unit == "unknown": 
-        x_unit = ""
-    else:
-        x_unit = " (" + x_dataType.unit + ")"
-    if y_dataType.unit == "unknown":
-        y_unit = ""
-    else:
-        y_unit = " (" + y_dataType.unit + ")"
+# This can be from the main window, as a breakout window, or as a saved graph.
+# Returns the axes, scatter, and connecting line (if any) so the plot can be updated in place.
+# plot_data can be given the output of clean_data_2D if it was already run, such as on a worker thread
+def make_plot_2D(figure, graph_object: GraphObject, plot_data = None):
+    if plot_data is None:
+        plot_data = clean_data_2D(graph_object)
+    x_vals, y_vals = plot_data
 
     plot = figure.add_subplot(111)
 
+    # Only hand matplotlib as many points as can be seen at the figure's resolution
+    shown = lttb_indices(x_vals, y_vals, plot_resolution(figure))
+    x_shown = np.asarray(x_vals)[shown]
+    y_shown = np.asarray(y_vals)[shown]
+
     # Plot the line connecting the points
+    line = None
     if graph_object.graph_style.connect_points:
-        plot.plot(x_vals, y_vals, color=graph_object.graph_style.marker_color, label=None, linewidth = 0.5)
+        line, = plot.plot(x_shown, y_shown, color=graph_object.graph_style.marker_color, label=None, linewidth = 0.5)
 
-    plot.scatter(x_vals, y_vals, marker=graph_object.graph_style.marker_style, label=graph_object.graph_style.line_name, s=graph_object.graph_style.marker_size, c=graph_object.graph_style.marker_color)
+    scatter = plot.scatter(x_shown, y_shown, marker=graph_object.graph_style.marker_style, label=graph_object.graph_style.line_name, s=graph_object.graph_style.marker_size, c=graph_object.graph_style.marker_color)
 
     if graph_object.graph_style.trend_line_type == "Linear":
         coefficients = np.polyfit(x_vals, y_vals, 1)
@@ -169,16 +354,14 @@ def make_plot_2D(figure, graph_object: GraphObject):
     if graph_object.graph_style.line_name != "":
         plot.legend()
 
-    plot.set_xlabel(graph_object.names[0] + x_unit)
-    plot.set_ylabel(graph_object.names[1] + y_unit)
-    plot.set_title(graph_object.plot_title)
+    update_plot_labels(plot, graph_object)
     plot.grid(graph_object.graph_style.show_grid_lines)
 
     plot_annotation = ""
     if graph_object.graph_style.show_min:
-        plot_annotation = plot_annotation + "X Min: " + "{:.2f}".format(min(x_vals)) + " Y Min: " + "{:.2f}".format(min(y_vals))
+        plot_annotation = plot_annotation + "X Min: " + "{:.2f}".format(x_vals.min()) + " Y Min: " + "{:.2f}".format(y_vals.min())
     if graph_object.graph_style.show_max:
-        plot_annotation = plot_annotation + "\n" + "X Max: " + "{:.2f}".format(max(x_vals)) + " Y Max: " + "{:.2f}".format(max(y_vals))
+        plot_annotation = plot_annotation + "\n" + "X Max: " + "{:.2f}".format(x_vals.max()) + " Y Max: " + "{:.2f}".format(y_vals.max())
     if graph_object.graph_style.show_stddev:
         plot_annotation = plot_annotation + "\n" + "X StdDev: " + "{:.2f}".format(np.std(x_vals)) + " Y StdDev: " + "{:.2f}".format(np.std(y_vals))
     if plot_annotation != "":
@@ -186,143 +369,82 @@ def make_plot_2D(figure, graph_object: GraphObject):
         annotation.draggable()
 
     if graph_object.graph_style.enforce_square:
-        max_range = max(
-            max(x_vals) - min(x_vals), 
-            max(y_vals) - min(y_vals), 
-        ) / 1.8
-
-        center_x = (max(x_vals) + min(x_vals)) / 2.0
-        center_y = (max(y_vals) + min(y_vals)) / 2.0
+        # One min and max reduction per axis, reused for the range and the center
+        lows = np.array([x_vals.min(), y_vals.min()])
+        highs = np.array([x_vals.max(), y_vals.max()])
+        max_range = (highs - lows).max() / 1.8
+        center_x, center_y = (highs + lows) / 2.0
 
         plot.set_xlim(center_x - max_range, center_x + max_range)
         plot.set_ylim(center_y - max_range, center_y + max_range)
         plot.set_box_aspect(1)
     else: plot.set_box_aspect(None)
 
-# Function which makes a 2 dimensional plot with color as a third dimension from a graph object. 
-# This can be from the main window, as a breakout window, or as a saved graph
-def make_plot_3D_color(figure, graph_object: GraphObject):
-    names = graph_object.names
-
-    x_dataType = graph_object.x_dataType
-    y_dataType = graph_object.y_dataType
+    return plot, scatter, line
+
+# Function which updates the artists of an existing 2 dimensional plot with new data instead of
+# rebuilding the whole plot. Only valid when nothing else drawn on the plot depends on the data
+def update_plot_2D(plot_artists, graph_object: GraphObject, plot_data = None):
+    plot, scatter, line = plot_artists
+    if plot_data is None:
+        plot_data = clean_data_2D(graph_object)
+    x_vals, y_vals = plot_data
+
+    shown = lttb_indices(x_vals, y_vals, plot_resolution(plot.figure))
+    offsets = np.column_stack([np.asarray(x_vals)[shown], np.asarray(y_vals)[shown]])
+    scatter.set_offsets(offsets)
+    if line is not None:
+        line.set_data(offsets[:, 0], offsets[:, 1])
+
+    plot.ignore_existing_data_limits = True
+    plot.update_datalim(offsets)
+    plot.autoscale()
+    update_plot_labels(plot, graph_object)
+
+# Function which gives the color limits of a color plot. With the color range enforced these are the
+# range of the color column padded by 5% on each side, otherwise the lowest and highest of the shown
+# color values, so matplotlib does not scan them again. None when there is nothing to show
+def color_limits(graph_object: GraphObject, color_shown):
     color_dataType = graph_object.z_dataType
+    if graph_object.graph_style.enforce_color_range and math.isfinite(color_dataType.range_low) and math.isfinite(color_dataType.range_high):
+        color_scale = (color_dataType.range_high - color_dataType.range_low) * 0.1 / 2
+        return color_dataType.range_low - color_scale, color_dataType.range_high + color_scale
+    if len(color_shown) == 0:
+        return None, None
+    return color_shown.min(), color_shown.max()
 
-    x_vals = graph_object.x_data.copy()
-    y_vals = graph_object.y_data.copy()
-    color_vals = graph_object.z_data.copy()
-
-    ranges = [
-        [x_dataType.range_low, x_dataType.range_high],
-        [y_dataType.range_low, y_dataType.range_high],
-        [color_dataType.range_low, color_dataType.range_high],
-    ]
-    convs = [x_dataType.conv, y_dataType.conv, color_dataType.conv]
-    precisions = [x_dataType.precision, y_dataType.precision, color_dataType.precision]
-    max_steps = [x_dataType.max_step, y_dataType.max_step, color_dataType.max_step]
-    starting_pos = [x_dataType.start_pos, y_dataType.start_pos, color_dataType.start_pos]
-
-    if x_dataType.unit == "unknown": 
-        x_unit = ""
-    else:
-        x_unit = " (" + x_dataType.unit + ")"
-    if y_dataType.unit == "unknown":
-        y_unit = ""
-    else:
-        y_unit = " (" + y_dataType.unit + ")"
-    if color_dataType.unit == "unknown":
-        color_unit = ""
-    else:
-        color_unit = " (" + color_dataType.unit + ")"
-
-    labels = [names[0] + x_unit, names[1] + y_unit, names[2] + color_unit]
-
-    if graph_object.graph_style.remove_out_of_range_data:
-        i = 0
-        while i < len(x_vals):
-            x_val = x_vals[i] * (x_dataType.conv / x_dataType.precision)
-            y_val = y_vals[i] * (y_dataType.conv / y_dataType.precision)
-            if x_val < x_dataType.range_low or x_val > x_dataType.range_high or y_val < y_dataType.range_low or y_val > y_dataType.range_high:
-                del x_vals[i]
-                del y_vals[i]
-                del color_vals[i]
-            else:
-                i += 1
-        x_vals[0] *= x_dataType.conv / x_dataType.precision
-        y_vals[0] *= y_dataType.conv / y_dataType.precision
-        color_vals[0] *= color_dataType.conv / color_dataType.precision
-    else:
-        if ranges[0][0] is not None:
-            if (x_vals[0] < ranges[0][0] or x_vals[0] > ranges[0][1]) and starting_pos[0] is not None:
-                x_vals[0] = starting_pos[0]
-
-        if ranges[1][0] is not None:
-            if (y_vals[0] < ranges[1][0] or y_vals[0] > ranges[1][1]) and starting_pos[1] is not None:
-                y_vals[0] = starting_pos[1]
-
-        if ranges[2][0] is not None:
-            if (color_vals[0] < ranges[2][0] or color_vals[0] > ranges[2][1]) and starting_pos[2] is not None:
-                color_vals[0] = starting_pos[2]
-
-    i = 1
-    while i < len(y_vals):
-        try:
-            x_vals[i] *= convs[0] / precisions[0]
-            y_vals[i] *= convs[1] / precisions[1]
-            color_vals[i] *= convs[2] / precisions[2]
-            if ranges[0] is not None:
-                if x_vals[i] < ranges[0][0] or x_vals[i] > ranges[0][1]:
-                    x_vals[i] = x_vals[i-1]
-
-            if ranges[1] is not None:
-                if y_vals[i] < ranges[1][0] or y_vals[i] > ranges[1][1]:
-                    y_vals[i] = y_vals[i-1]
-            
-            if ranges[2] is not None:
-                if color_vals[i] < ranges[2][0] or color_vals[i] > ranges[2][1]:
-                    color_vals[i] = color_vals[i-1]
+# Colormap of the color plots, looked up once rather than by name for every new plot
+COLOR_MAP = colormaps["nipy_spectral"]
 
-            if max_steps[0] is not None:
-                if abs(x_vals[i] - x_vals[i-1]) > max_steps[0]:
-                    x_vals[i] = x_vals[i-1]
-                    
-            if max_steps[1] is not None:
-                if abs(y_vals[i] - y_vals[i-1]) > max_steps[1]:
-                    y_vals[i] = y_vals[i-1]
-
-            if max_steps[2] is not None:
-                if abs(color_vals[i] - color_vals[i-1]) > max_steps[2]:
-                    color_vals[i] = color_vals[i-1]
-
-        except TypeError:
-            print("type error")
-            print(i)
-            x_vals.pop(i)
-            y_vals.pop(i)
-            color_vals.pop(i)
-        i += 1
+# Function which makes a 2 dimensional plot with color as a third dimension from a graph object. 
+# This can be from the main window, as a breakout window, or as a saved graph
+# Returns the axes, scatter, and connecting line (if any) so the plot can be updated in place
+def make_plot_3D_color(figure, graph_object: GraphObject, plot_data = None):
+    if plot_data is None:
+        plot_data = clean_data_3D(graph_object, False)
+    x_vals, y_vals, color_vals = plot_data
 
     plot = figure.add_subplot(111)
 
-    color_scale = 0
-    color_scale_low = None
-    color_scale_high = None
-
-    if graph_object.graph_style.enforce_color_range:
-        color_scale = (color_dataType.range_high - color_dataType.range_low) * 0.1 / 2
-        color_scale_low = color_dataType.range_low - color_scale
-        color_scale_high = color_dataType.range_high + color_scale
+    # Only hand matplotlib as many points as can be seen at the figure's resolution, keeping
+    # the color of each point that is picked
+    shown = lttb_indices(x_vals, y_vals, plot_resolution(figure))
+    x_shown = np.asarray(x_vals)[shown]
+    y_shown = np.asarray(y_vals)[shown]
+    color_shown = np.asarray(color_vals)[shown]
+    color_scale_low, color_scale_high = color_limits(graph_object, color_shown)
 
     # Add colored scatter points
-    scatter = plot.scatter(x_vals, y_vals, c=color_vals, cmap='nipy_spectral', vmin = color_scale_low, vmax = color_scale_high, marker=graph_object.graph_style.marker_style, label=graph_object.graph_style.line_name, s=graph_object.graph_style.marker_size)
+    scatter = plot.scatter(x_shown, y_shown, c=color_shown, cmap=COLOR_MAP, vmin = color_scale_low, vmax = color_scale_high, marker=graph_object.graph_style.marker_style, label=graph_object.graph_style.line_name, s=graph_object.graph_style.marker_size)
 
     # Plot the line connecting the points
+    line = None
     if graph_object.graph_style.connect_points:
-        plot.plot(x_vals, y_vals, color = "black", label=None, linewidth = 0.5)
+        line, = plot.plot(x_shown, y_shown, color = "black", label=None, linewidth = 0.5)
 
     # Add color bar
     cbar = figure.colorbar(scatter, ax=plot)
-    cbar.set_label(labels[2])
+    cbar.set_label(axis_label(graph_object.names[2], graph_object.z_dataType))
 
     if graph_object.graph_style.trend_line_type == "Linear":
         coefficients = np.polyfit(x_vals, y_vals, 1)
@@ -346,9 +468,7 @@ def make_plot_3D_color(figure, graph_object: GraphObject):
         plot.legend()
 
     # Set plot attributes
-    plot.set_title(graph_object.plot_title)
-    plot.set_xlabel(labels[0])
-    plot.set_ylabel(labels[1])
+    update_plot_labels(plot, graph_object)
 
     # Enable grid if specified
     if graph_object.graph_style.show_grid_lines:
@@ -356,9 +476,9 @@ def make_plot_3D_color(figure, graph_object: GraphObject):
 
     plot_annotation = ""
     if graph_object.graph_style.show_min:
-        plot_annotation = plot_annotation + "X Min: " + "{:.2f}".format(min(x_vals)) + " Y Min: " + "{:.2f}".format(min(y_vals)) + " Color Min: " + "{:.2f}".format(min(color_vals))
+        plot_annotation = plot_annotation + "X Min: " + "{:.2f}".format(x_vals.min()) + " Y Min: " + "{:.2f}".format(y_vals.min()) + " Color Min: " + "{:.2f}".format(color_vals.min())
     if graph_object.graph_style.show_max:
-        plot_annotation = plot_annotation + "\n" + "X Max: " + "{:.2f}".format(max(x_vals)) + " Y Max: " + "{:.2f}".format(max(y_vals)) + " Color Max: " + "{:.2f}".format(max(color_vals))
+        plot_annotation = plot_annotation + "\n" + "X Max: " + "{:.2f}".format(x_vals.max()) + " Y Max: " + "{:.2f}".format(y_vals.max()) + " Color Max: " + "{:.2f}".format(color_vals.max())
     if graph_object.graph_style.show_stddev:
         plot_annotation = plot_annotation + "\n" + "X StdDev: " + "{:.2f}".format(np.std(x_vals)) + " Y StdDev: " + "{:.2f}".format(np.std(y_vals)) + " Color StdDev: " + "{:.2f}".format(np.std(color_vals))
     if plot_annotation != "":
@@ -367,150 +487,73 @@ def make_plot_3D_color(figure, graph_object: GraphObject):
 
     # Enforce square aspect ratio if specified
     if graph_object.graph_style.enforce_square:
-        max_range = max(
-            max(x_vals) - min(x_vals), 
-            max(y_vals) - min(y_vals), 
-        ) / 1.8
-
-        center_x = (max(x_vals) + min(x_vals)) / 2.0
-        center_y = (max(y_vals) + min(y_vals)) / 2.0
+        # One min and max reduction per axis, reused for the range and the center
+        lows = np.array([x_vals.min(), y_vals.min()])
+        highs = np.array([x_vals.max(), y_vals.max()])
+        max_range = (highs - lows).max() / 1.8
+        center_x, center_y = (highs + lows) / 2.0
 
         plot.set_xlim(center_x - max_range, center_x + max_range)
         plot.set_ylim(center_y - max_range, center_y + max_range)
         plot.set_box_aspect(1)
     else: plot.set_box_aspect(None)
 
+    return plot, scatter, line
+
+# Function which updates the artists and color bar of an existing color plot with new data instead
+# of rebuilding the whole plot. Only valid when nothing else drawn on the plot depends on the data
+def update_plot_3D_color(plot_artists, graph_object: GraphObject, plot_data = None):
+    plot, scatter, line = plot_artists
+    if plot_data is None:
+        plot_data = clean_data_3D(graph_object, False)
+    x_vals, y_vals, color_vals = plot_data
+
+    shown = lttb_indices(x_vals, y_vals, plot_resolution(plot.figure))
+    offsets = np.column_stack([np.asarray(x_vals)[shown], np.asarray(y_vals)[shown]])
+    color_shown = np.asarray(color_vals)[shown]
+    scatter.set_offsets(offsets)
+    scatter.set_array(color_shown)
+    if line is not None:
+        line.set_data(offsets[:, 0], offsets[:, 1])
+
+    color_scale_low, color_scale_high = color_limits(graph_object, color_shown)
+    scatter.set_clim(color_scale_low, color_scale_high)
+    scatter.colorbar.update_normal(scatter)
+    scatter.colorbar.set_label(axis_label(graph_object.names[2], graph_object.z_dataType))
+
+    plot.ignore_existing_data_limits = True
+    plot.update_datalim(offsets)
+    plot.autoscale()
+    update_plot_labels(plot, graph_object)
+
 # Function which makes a 3 dimensional plot from a graph object. 
 # This can be from the main window, as a breakout window, or as a saved graph
-def make_plot_3D(figure, graph_object: GraphObject):
-    names = graph_object.names
-
-    x_dataType = graph_object.x_dataType
-    y_dataType = graph_object.y_dataType
-    z_dataType = graph_object.z_dataType
-
-    x_vals = graph_object.x_data.copy()
-    y_vals = graph_object.y_data.copy()
-    z_vals = graph_object.z_data.copy()
-
-    convs = [x_dataType.conv, y_dataType.conv, z_dataType.conv]
-    ranges = [
-        [x_dataType.range_low, x_dataType.range_high],
-        [y_dataType.range_low, y_dataType.range_high],
-        [z_dataType.range_low, z_dataType.range_high],
-    ]
-    precisions = [x_dataType.precision, y_dataType.precision, z_dataType.precision]
-    max_steps = [x_dataType.max_step, y_dataType.max_step, z_dataType.max_step]
-    start_pos = [x_dataType.start_pos, y_dataType.start_pos, z_dataType.start_pos]
-
-    if x_dataType.unit == "unknown": 
-        x_unit = ""
-    else:
-        x_unit = " (" + x_dataType.unit + ")"
-    if y_dataType.unit == "unknown":
-        y_unit = ""
-    else:
-        y_unit = " (" + y_dataType.unit + ")"
-    if z_dataType.unit == "unknown":
-        z_unit = ""
-    else:
-        z_unit = " (" + z_dataType.unit + ")"
-
-    labels = [names[0] + x_unit, names[1] + y_unit, names[2] + z_unit]
-
-
-    if graph_object.graph_style.remove_out_of_range_data:
-        i = 0
-        while i < len(x_vals):
-            x_val = x_vals[i] * convs[0] / precisions[0]
-            y_val = y_vals[i] * convs[1] / precisions[1]
-            z_val = z_vals[i] * convs[2] / precisions[2]
-            if (x_val < ranges[0][0] or x_val > ranges[0][1] or
-                y_val < ranges[1][0] or y_val > ranges[1][1] or
-                z_val < ranges[2][0] or z_val > ranges[2][1]):
-                x_vals.pop(i)
-                y_vals.pop(i)
-                z_vals.pop(i)
-            else:
-                i += 1
-        x_vals[0] *= x_dataType.conv / x_dataType.precision
-        y_vals[0] *= y_dataType.conv / y_dataType.precision
-        z_vals[0] *= z_dataType.conv / z_dataType.precision
-    else:
-        if ranges[0][0] is not None:
-            if (x_vals[0] < ranges[0][0] or x_vals[0] > ranges[0][1]) and start_pos[0] is not None:
-                x_vals[0] = start_pos[0]
-
-        if ranges[1][0] is not None:
-            if (y_vals[0] < ranges[1][0] or y_vals[0] > ranges[1][1]) and start_pos[1] is not None:
-                y_vals[0] = start_pos[1]
-
-        if ranges[2][0] is not None:
-            if (z_vals[0] < ranges[2][0] or z_vals[0] > ranges[2][1]) and start_pos[2] is not None:
-                z_vals[0] = start_pos[2]
-
-    i = 1
-    while i < len(y_vals):
-        try:
-            x_vals[i] *= convs[0] / precisions[0]
-            y_vals[i] *= convs[1] / precisions[1]
-            z_vals[i] *= convs[2] / precisions[2]
-            if ranges[0] is not None:
-                if x_vals[i] < ranges[0][0] or x_vals[i] > ranges[0][1]:
-                    x_vals[i] = x_vals[i-1]
-
-            if ranges[1] is not None:
-                if y_vals[i] < ranges[1][0] or y_vals[i] > ranges[1][1]:
-                    y_vals[i] = y_vals[i-1]
-            
-            if ranges[2] is not None:
-                if z_vals[i] < ranges[2][0] or z_vals[i] > ranges[2][1]:
-                    z_vals[i] = z_vals[i-1]
-
-            if max_steps[0] is not None:
-                if abs(x_vals[i] - x_vals[i-1]) > max_steps[0]:
-                    x_vals[i] = x_vals[i-1]
-                    
-            if max_steps[1] is not None:
-                if abs(y_vals[i] - y_vals[i-1]) > max_steps[1]:
-                    y_vals[i] = y_vals[i-1]
-            
-            if max_steps[2] is not None:
-                if abs(z_vals[i] - z_vals[i-1]) > max_steps[2]:
-                    z_vals[i] = z_vals[i-1]
-
-        except TypeError:
-            print("type error")
-            print(i)
-            x_vals.pop(i)
-            y_vals.pop(i)
-            z_vals.pop(i)
-            i -= 1
-
-        i += 1
+# Returns the axes, scatter, and connecting line (if any) so the plot can be updated in place
+def make_plot_3D(figure, graph_object: GraphObject, plot_data = None):
+    if plot_data is None:
+        plot_data = clean_data_3D(graph_object, True)
+    x_vals, y_vals, z_vals = plot_data
 
     plot = figure.add_subplot(111, projection='3d')
 
     # Set labels and title
-    plot.set_title(graph_object.plot_title)
-    plot.set_xlabel(labels[0])
-    plot.set_ylabel(labels[1])
-    plot.set_zlabel(labels[2])
+    update_plot_labels(plot, graph_object)
 
     # Scatter plot for the 3D data
+    x_shown, y_shown, z_shown, sizes = sample_points_3D(x_vals, y_vals, z_vals, graph_object.graph_style.marker_size)
+    scatter = plot.scatter(x_shown, y_shown, z_shown, edgecolor='none', alpha=0.8, marker=graph_object.graph_style.marker_style, label=graph_object.graph_style.line_name, s=sizes, c=graph_object.graph_style.marker_color)
 
-    plot.scatter(x_vals, y_vals, z_vals, edgecolor='none', alpha=0.8, marker=graph_object.graph_style.marker_style, label=graph_object.graph_style.line_name, s=graph_object.graph_style.marker_size, c=graph_object.graph_style.marker_color)
-
-    if graph_object.graph_style.connect_points: plot.plot(x_vals, y_vals, z_vals, color=graph_object.graph_style.marker_color)
+    line = None
+    if graph_object.graph_style.connect_points: line, = plot.plot(x_vals, y_vals, z_vals, color=graph_object.graph_style.marker_color)
 
     # Enable grid if specified
     plot.grid(graph_object.graph_style.show_grid_lines)
 
     plot_annotation = ""
     if graph_object.graph_style.show_min:
-        plot_annotation = plot_annotation + "X Min: " + "{:.2f}".format(min(x_vals)) + " Y Min: " + "{:.2f}".format(min(y_vals)) + " Z Min: " + "{:.2f}".format(min(z_vals))
+        plot_annotation = plot_annotation + "X Min: " + "{:.2f}".format(x_vals.min()) + " Y Min: " + "{:.2f}".format(y_vals.min()) + " Z Min: " + "{:.2f}".format(z_vals.min())
     if graph_object.graph_style.show_max:
-        plot_annotation = plot_annotation + "\n" + "X Max: " + "{:.2f}".format(max(x_vals)) + " Y Max: " + "{:.2f}".format(max(y_vals)) + " Z Max: " +  "{:.2f}".format(max(z_vals))
+        plot_annotation = plot_annotation + "\n" + "X Max: " + "{:.2f}".format(x_vals.max()) + " Y Max: " + "{:.2f}".format(y_vals.max()) + " Z Max: " +  "{:.2f}".format(z_vals.max())
     if graph_object.graph_style.show_stddev:
         plot_annotation = plot_annotation + "\n" + "X StdDev: " + "{:.2f}".format(np.std(x_vals)) + " Y StdDev: " + "{:.2f}".format(np.std(y_vals)) + " Z StdDev: " +  "{:.2f}".format(np.std(z_vals))
     if plot_annotation != "":
@@ -519,15 +562,11 @@ def make_plot_3D(figure, graph_object: GraphObject):
 
     # Enforce cube aspect ratio if specified (not straightforward in 3D but can scale axes)
     if graph_object.graph_style.enforce_square:
-        max_range = max(
-            max(x_vals) - min(x_vals), 
-            max(y_vals) - min(y_vals), 
-            max(z_vals) - min(z_vals)
-        ) / 1.8
-
-        center_x = (max(x_vals) + min(x_vals)) / 2.0
-        center_y = (max(y_vals) + min(y_vals)) / 2.0
-        center_z = (max(z_vals) + min(z_vals)) / 2.0
+        # One min and max reduction per axis, reused for the range and the center
+        lows = np.array([x_vals.min(), y_vals.min(), z_vals.min()])
+        highs = np.array([x_vals.max(), y_vals.max(), z_vals.max()])
+        max_range = (highs - lows).max() / 1.8
+        center_x, center_y, center_z = (highs + lows) / 2.0
 
         plot.set_xlim(center_x - max_range, center_x + max_range)
         plot.set_ylim(center_y - max_range, center_y + max_range)
@@ -535,15 +574,35 @@ def make_plot_3D(figure, graph_object: GraphObject):
         plot.set_box_aspect((1,1,1))
     else: plot.set_box_aspect(None)
 
+    return plot, scatter, line
+
+# Function which updates the artists of an existing 3 dimensional plot with new data instead of
+# rebuilding the whole plot, keeping the current view angle. Only valid when nothing else drawn on
+# the plot depends on the data
+def update_plot_3D(plot_artists, graph_object: GraphObject, plot_data = None):
+    plot, scatter, line = plot_artists
+    if plot_data is None:
+        plot_data = clean_data_3D(graph_object, True)
+    x_vals, y_vals, z_vals = plot_data
+
+    x_shown, y_shown, z_shown, sizes = sample_points_3D(x_vals, y_vals, z_vals, graph_object.graph_style.marker_size)
+    scatter._offsets3d = (x_shown, y_shown, z_shown)
+    scatter.set_sizes(np.atleast_1d(sizes))
+    if line is not None:
+        line.set_data_3d(x_vals, y_vals, z_vals)
+
+    plot.set_autoscale_on(True)
+    plot.auto_scale_xyz(x_vals, y_vals, z_vals, had_data=False)
+    update_plot_labels(plot, graph_object)
+
+# The graphing and updating functions of each "plot_type", indexed by it (0: 2D, 1: 3D with color, 2: 3D)
+PLOT_FUNCTIONS = (make_plot_2D, make_plot_3D_color, make_plot_3D)
+UPDATE_FUNCTIONS = (update_plot_2D, update_plot_3D_color, update_plot_3D)
+
 # Generic function to take any graph_object and call the 
-# correct graphing function based on the "plot_type"
-def make_plot(figure, graph_object: GraphObject):
-    if graph_object.plot_type == 1:
-        make_plot_2D(figure, graph_object)
-    elif graph_object.plot_type == 2:
-        make_plot_3D_color(figure, graph_object)
-    else:
-        make_plot_3D(figure, graph_object)
+# correct graphing function based on the "plot_type". Returns the artists of the plot
+def make_plot(figure, graph_object: GraphObject, plot_data = None):
+    return PLOT_FUNCTIONS[graph_object.plot_type](figure, graph_object, plot_data)
 
 #################################################
 # Class: DataType
@@ -561,11 +620,17 @@ def make_plot(figure, graph_object: GraphObject):
 #   max_step: The largest allowable step per unit
 #    of time for data. Like a low pass filter
 #   start_pos: A default starting value for data
+# An unset range or max step is +/- math.inf
 # Methods:
 #   reinit(): allows resetting of all attributes
+#   scale: property for conv / precision
+# Uses __slots__ as one is made per CSV column
+# and its attributes are read in the plot loops
 #################################################
 class DataType:
-    def __init__(self, index = 0, unit = 'unknown', conv = 1, precision = 1, range_low = -18446744073709551615, range_high = 18446744073709551615, max_step = 18446744073709551615, start_pos = 0):
+    __slots__ = ('index', 'unit', 'conv', 'precision', 'range_low', 'range_high', 'max_step', 'start_pos')
+
+    def __init__(self, index = 0, unit = 'unknown', conv = 1, precision = 1, range_low = -math.inf, range_high = math.inf, max_step = math.inf, start_pos = 0):
         self.index = index
         self.unit = unit
         self.conv = conv
@@ -584,6 +649,34 @@ class DataType:
         self.max_step = max_step
         self.start_pos = start_pos
 
+    # Files written before the math.inf sentinel used +/-18446744073709551615 for an unset
+    # limit, so anything past 17e18 is read back as unset
+    @staticmethod
+    def to_limit(value):
+        value = float(value)
+        if value > 17000000000000000000: return math.inf
+        if value < -17000000000000000000: return -math.inf
+        return value
+
+    # Multiplier taking the logged values to the displayed unit. Worked out when read rather than stored,
+    # so a bad conversion or precision only fails the graphs which use it, not loading the data
+    @property
+    def scale(self):
+        return self.conv / self.precision
+
+    # True while the header still has every default, so a config file may fill it in
+    def is_unset(self):
+        return (self.conv == 1 and self.unit == "unknown" and self.precision == 1 and self.range_low == -math.inf and
+                self.range_high == math.inf and self.max_step == math.inf and self.start_pos == 0)
+
+    # Graphs saved before DataType used __slots__ pickled its attributes as a plain dict, while
+    # newer ones store a (None, slots) pair. Both are restored attribute by attribute
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            state = state[1]
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def setUnit(self, unit):
         self.unit = unit
 
@@ -593,6 +686,9 @@ class DataType:
     def setPrecision(self, prc):
         self.precision = prc
 
+# Version of the CACHE.NPZ layout, bump this when the cached contents change
+CACHE_VERSION = 2
+
 #################################################
 # Class: Dataframe
 # Attributes: 
@@ -602,7 +698,10 @@ class DataType:
 #    the CSV.
 #   headers: Dict for all headers stored as
 #    name: DataType.
-#   df: 2D array for actual data being stored
+#   df: List of numpy arrays for the actual data
+#    being stored, one per column (DataType.index)
+#   dtype: Compact float type used for columns
+#    that can be stored without losing precision
 #   restarts: array to hold where in CSV there
 #    are restarts occurring.
 #   fill_headers: dict storing which headers
@@ -615,33 +714,67 @@ class Dataframe:
         self.header_version = 1
         self.headers = {}
         self.df = []
+        self.dtype = np.float32
         self.restarts = [0]
         self.fill_headers = {}
         self.dir_path = ""
 
     def __str__(self):
         print(self.headers)
-        for line in self.df:
+        for line in zip(*self.df):
             print(line)
         return ""
+
+    # Function which converts the parsed rows into one numpy array per column. The logged data is
+    # mostly precision-scaled ints, so any column which fits into self.dtype without losing
+    # precision is downcast to it. Time always stays as float64 to keep its microsecond resolution,
+    # and columns holding text (such as GLOBAL time) are kept as object arrays so they can be saved
+    def rows_to_columns(self, rows):
+        time_index = self.headers["Time"].index if "Time" in self.headers else None
+        columns = []
+        for i, values in enumerate(itertools.zip_longest(*rows)):
+            try:
+                column = np.array(values, dtype=np.float64)
+            except (TypeError, ValueError):
+                columns.append(np.array(values, dtype=object))
+                continue
+            if i != time_index:
+                compact = column.astype(self.dtype)
+                if np.array_equal(compact, column, equal_nan=True):
+                    column = compact
+            columns.append(column)
+
+        # Headers with no values in any row still get an (empty) column
+        while len(columns) < len(self.headers):
+            columns.append(np.full(len(rows), np.nan, dtype=self.dtype))
+        return columns
+
+    # Function which fills the gaps in a column with the last value logged before them, or 0 if
+    # nothing has been logged yet. This is used for the lower HZ columns, which only have values
+    # on the rows closest to when they were logged
+    @staticmethod
+    def hold_values(column):
+        if column.dtype == object:
+            logged = np.array([value is not None for value in column], dtype=bool)
+        else:
+            logged = ~np.isnan(column)
+        sources = np.where(logged, np.arange(len(column)), -1)
+        np.maximum.accumulate(sources, out=sources)
+        held = column[sources]
+        held[sources < 0] = 0
+        return held
     
-    # Function to create a buffer str from the headers, used to store these values into a CSV
+    # Function to create a buffer str from the headers, used to store these values into a CSV.
+    # All eight header rows are built from a single pass over the headers
     def headers_to_CSV(self):
-        buf = ""
-        buf += ','.join([str(header) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].unit) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].conv) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].precision) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].range_low) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].range_high) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].max_step) for header in self.headers]) + '\n'
-        buf += ','.join([str(self.headers[header].start_pos) for header in self.headers]) + '\n'
-        return buf
+        columns = [(name, data_type.unit, data_type.conv, data_type.precision, data_type.range_low,
+                    data_type.range_high, data_type.max_step, data_type.start_pos) for name, data_type in self.headers.items()]
+        return '\n'.join([','.join(map(str, row)) for row in zip(*columns)]) + '\n'
     
     # Function to convert the stored data into a CSV format for storing. Returns a string
     def data_to_CSV(self):
         buf = ""
-        buf += '\n'.join([','.join([str(item) for item in line]) for line in self.df])
+        buf += '\n'.join([','.join([str(item) for item in line]) for line in zip(*[column.tolist() for column in self.df])])
         return buf
     
     # Function which attempts to save all data in header v2 format into a "MONOLITH.CSV" file
@@ -726,47 +859,41 @@ class Dataframe:
                 temp_dict[names[i]] = DataType(i, units[i], float(conversions[i]), float(precisions[i]))
             return temp_dict
         
-        # Function which inserts values from the given line into the data. This is used as the
+        # Function which inserts values from the given lines into the data. This is used as the
         # logging rates are uneven, so data must be filled in to the nearest time value from the
-        # lower HZ values into the higher HZ values.
-        def insert_value(line, start):
-            time = line.pop(0)
-            ret = 0
-            for x in range(start, len(self.df)):
-                if self.df[x][0] > time:
-                    self.df[x] = self.df[x] + (line)
-                    return x+1
-                else:
-                    self.df[x] = self.df[x] + ([None]*len(line))
-            if ret == 0 and start > 100:
-                ret = -1
-            return ret
+        # lower HZ values into the higher HZ values. Each line is placed on the first row after its
+        # time, found with a binary search over the Time column, and all rows are extended once.
+        def insert_values(lines, width):
+            times = np.array([row[0] for row in self.df])
+            slots = np.searchsorted(times, [line[0] for line in lines], side='right')
+            extensions = [[None]*width] * len(self.df)
+            for slot, line in zip(slots, lines):
+                if slot < len(extensions):
+                    extensions[slot] = line[1:]
+            for row, extension in zip(self.df, extensions):
+                row.extend(extension)
         
         # Function which takes the lower HZ files and fills that data into the larger HZ data,
         # appending all new headers and ignoring repeated headers (such as time)
         def low_HZ_append(file):
             header_remove_dict = {}
             offset_loc = 0
-            start = 0
+            lines = []
             newheaders = {}
 
             if self.header_version == 1:
                 newheaders = header_v1(file)
             elif self.header_version ==2:
                 newheaders = header_v2(file)
+            # Only the headers new to the data need filling, repeated ones are removed from the lines
             for NH in newheaders:
                 if NH not in self.headers:
                     self.headers[NH] = newheaders[NH]
                     self.headers[NH].index = len(self.headers) - 1
+                    self.fill_headers[NH] = newheaders[NH]
                 elif NH != 'Time':
                     header_remove_dict[NH] = newheaders[NH]
 
-            self.fill_headers.update(newheaders.copy())
-
-            for x in header_remove_dict:
-                self.fill_headers.pop(x) 
-            self.fill_headers.pop("Time")
-
             while True:
                 line = file.readline()
                 if not line: break
@@ -787,10 +914,9 @@ class Dataframe:
                     print(offset_loc, len(self.restarts))
                 for x in header_remove_dict:
                     line.pop(header_remove_dict[x].index)
-                
-                start = insert_value(line, start)
-                if start == -1:
-                    break
+                lines.append(line)
+
+            insert_values(lines, len(newheaders) - len(header_remove_dict) - 1)
 
         # Function which is used to read in the data in the event no MONOLITH.CSV has been
         # created yet. The default files then are 1HZLOG, 10HZLOG, and 100HZLOG
@@ -835,30 +961,12 @@ class Dataframe:
             low_HZ_append(file10)
             low_HZ_append(file1)
 
-            for i in range(len(self.df)):
-                if len(self.df[i]) < len(self.headers):
-                    self.df[i] = self.df[i] + ([None]*(len(self.headers)-len(self.df[i])))
-
+            # Store the data column-wise, which pads out any short rows, and fill the gaps left in
+            # the lower HZ columns. The last row is dropped as its lower HZ values were not logged
+            self.df = self.rows_to_columns(self.df[:-1])
             for header in self.fill_headers:
                 y = self.headers[header].index
-
-                first = 0
-                first_ind = 0
-                for x in range(len(self.df)):
-                    while x < len(self.df)-1 and self.df[x][y] is None:
-                        x +=1
-            
-                    second = self.df[x][y]
-                    
-                    second_ind = x
-                    index_range = second_ind - first_ind
-
-                    for i in range(index_range):
-                        self.df[first_ind+i][y] = first 
-                    first = second
-                    first_ind = second_ind
-            
-            self.df.pop()
+                self.df[y] = self.hold_values(self.df[y])
 
         # Function which reads in the data from the MONOLITH.CSV, in the header v2 format with
         # additional ranges, max_step, and start_vals
@@ -876,7 +984,7 @@ class Dataframe:
             start_vals = monolith.readline().rstrip().split(",")
             for i in indices:
                 try:
-                    self.headers[headers[i]] = DataType(i, units[i], float(convs[i]), float(precisions[i]), float(range_lows[i]), float(range_highs[i]), float(max_steps[i]), float(start_vals[i]))
+                    self.headers[headers[i]] = DataType(i, units[i], float(convs[i]), float(precisions[i]), DataType.to_limit(range_lows[i]), DataType.to_limit(range_highs[i]), DataType.to_limit(max_steps[i]), float(start_vals[i]))
                 except ValueError:
                     self.headers[headers[i]] = DataType(i)
 
@@ -886,6 +994,8 @@ class Dataframe:
                 line = convert_list_to_num(line.rstrip().split(','))
                 if None not in line:
                     self.df.append(line)
+
+            self.df = self.rows_to_columns(self.df)
         
         # Function which reads a singluar CSV file from the path, in a header V1 format only
         def read_from_csv():
@@ -902,6 +1012,46 @@ class Dataframe:
                     if None not in line:
                         self.df.append(line)
 
+            self.df = self.rows_to_columns(self.df)
+
+        # Function which reads the data back from the CACHE.NPZ file written by write_cache. The
+        # cache is only used when it is newer than every data file in the directory and was made
+        # from the same source (MONOLITH.CSV or the three log files). Returns whether it was used
+        def read_cache():
+            cache_path = dir_path + "/CACHE.NPZ"
+            sources = [dir_path + "/" + name for name in ("MONOLITH.CSV", "1HZLOG.CSV", "10HZLOG.CSV", "100HZLOG.CSV")]
+            try:
+                cache_time = os.path.getmtime(cache_path)
+                if any(os.path.exists(source) and os.path.getmtime(source) >= cache_time for source in sources):
+                    return False
+                with np.load(cache_path) as cache:
+                    meta = json.loads(str(cache["meta"]))
+                    if meta["version"] != CACHE_VERSION or meta["monolith"] != detect_monolith(dir_path):
+                        return False
+                    columns = [cache["column_" + str(i)] for i in range(meta["columns"])]
+            except Exception:
+                return False
+
+            for name, fields in meta["headers"].items():
+                self.headers[name] = DataType(*fields)
+            # Text columns are cached as fixed width strings so no pickling is needed
+            self.df = [column.astype(object) if column.dtype.kind == 'U' else column for column in columns]
+            return True
+
+        # Function which writes the parsed columns and headers into a CACHE.NPZ file in the
+        # directory, so the next load of the same data does not need to parse the CSVs again
+        def write_cache():
+            headers = {name: [data_type.index, data_type.unit, data_type.conv, data_type.precision, data_type.range_low,
+                              data_type.range_high, data_type.max_step, data_type.start_pos]
+                       for name, data_type in self.headers.items()}
+            meta = {"version": CACHE_VERSION, "monolith": detect_monolith(dir_path), "columns": len(self.df), "headers": headers}
+            columns = {"column_" + str(i): column.astype(str) if column.dtype == object else column for i, column in enumerate(self.df)}
+            try:
+                with open(dir_path + "/CACHE.NPZ", 'wb') as f:
+                    np.savez(f, meta=np.array(json.dumps(meta)), **columns)
+            except Exception:
+                print("Something went wrong writing the cache file")
+
         # Function to load in the config file into the DataTypes. This file is a global
         # configuration and not meant to edited by the regular user. If other FSAE teams are
         # using this project, it is highly recommended that this file be edited once to match
@@ -919,43 +1069,67 @@ class Dataframe:
                     config[line[0]] = line[1:]
             for header in self.headers:
                 if header in config:
-                    if(self.headers[header].conv == 1 and self.headers[header].unit == "unknown" and self.headers[header].precision == 1 and
-                    self.headers[header].range_low < -17000000000000000000 and self.headers[header].range_high > 17000000000000000000 and
-                    self.headers[header].max_step > 17000000000000000000 and self.headers[header].start_pos == 0):
-                        self.headers[header].conv = config[header][0]
-                        self.headers[header].unit = config[header][1]
-                        self.headers[header].precision = config[header][2]
-                        self.headers[header].range_low = config[header][3]
-                        self.headers[header].range_high = config[header][4]
-                        self.headers[header].max_step = config[header][5]
-                        self.headers[header].start_pos = config[header][6]
+                    if self.headers[header].is_unset():
+                        conv, unit, precision, range_low, range_high, max_step, start_pos = config[header][:7]
+                        self.headers[header].reinit(unit, conv, precision, DataType.to_limit(range_low), DataType.to_limit(range_high),
+                                                    DataType.to_limit(max_step), start_pos)
 
         if is_dir:
             # Set global path
             self.dir_path = dir_path
 
-            # Search for a MONOLITH.CSV in the path, and if found then read it in,
+            # Use the cache from a previous load if the data has not changed since. Otherwise
+            # search for a MONOLITH.CSV in the path, and if found then read it in,
             # else, read in from the three default files
-            if(detect_monolith(dir_path)):
-                read_monolith()
-            else:
-                no_monolith()
+            if not read_cache():
+                if(detect_monolith(dir_path)):
+                    read_monolith()
+                else:
+                    no_monolith()
+                write_cache()
         else:
             #Set global path
             self.dir_path = os.path.dirname(dir_path)
             read_from_csv()
             
-            # Finally, load in the config file
+        # Finally, load in the config file
         load_config()
 
-# Worker class used to async run functions
+# Worker class used to async run functions. The function is held by the worker so that run() is
+# a slot of an object moved to the thread, and so actually runs on that thread
 class Worker(QObject):
-    finished = pyqtSignal(bool)
+    finished = pyqtSignal(object)
+
+    def __init__(self, function):
+        super().__init__()
+        self.function = function
 
-    def run(self,function):
-        result = function()  
+    def run(self):
+        result = self.function()
         self.finished.emit(result)
 
+# Class which holds the widgets of one axis section (X, Y, or Z) as attributes, rather than looking
+# them up by name. The settings they show stay on the DataType of the selected header
+class AxisSection:
+    __slots__ = ('dropdown', 'conversion_rate_input', 'unit_input', 'precision_input', 'range_low_input',
+                 'range_high_input', 'max_step_input', 'start_pos_input', 'save_button')
+
+    def __init__(self, dropdown, conversion_rate_input, unit_input, precision_input, range_low_input,
+                 range_high_input, max_step_input, start_pos_input, save_button):
+        self.dropdown = dropdown
+        self.conversion_rate_input = conversion_rate_input
+        self.unit_input = unit_input
+        self.precision_input = precision_input
+        self.range_low_input = range_low_input
+        self.range_high_input = range_high_input
+        self.max_step_input = max_step_input
+        self.start_pos_input = start_pos_input
+        self.save_button = save_button
+
+# Style sheet given to the buttons which light up green to show that they should be pressed. Toggling
+# the "highlighted" property only re-polishes the button, where setting a new style sheet reparses it
+HIGHLIGHT_STYLE = 'QPushButton[highlighted="true"] { background-color: #0BA87A; }'
+
 # Canvas class to embedd into the window for plots
 class MplCanvas(FigureCanvasQTAgg):
     def __init__(self, width=5, height=4, dpi=100):
@@ -1006,10 +1180,14 @@ class MizzouDataTool(QMainWindow):
         browse_file_button.clicked.connect(self.browse_file)
         generate_df_button = QPushButton("Generate Data Frame")
         generate_df_button.setObjectName("generate_df_button")
+        generate_df_button.setStyleSheet(HIGHLIGHT_STYLE)
         generate_df_button.clicked.connect(self.generate_data_frame)
+        self.generate_df_button = generate_df_button
         save_df_button = QPushButton("Save Data Frame")
         save_df_button.setObjectName("save_df_button")
+        save_df_button.setStyleSheet(HIGHLIGHT_STYLE)
         save_df_button.clicked.connect(self.save_data_frame)
+        self.save_df_button = save_df_button
         file_path_layout.addWidget(file_path_label)
         file_path_layout.addWidget(self.file_path_input)
         file_path_layout.addWidget(browse_button)
@@ -1018,8 +1196,11 @@ class MizzouDataTool(QMainWindow):
         file_path_layout.addWidget(save_df_button)
         main_layout.addLayout(file_path_layout)
 
-        # Axis Selection Section
+        # Axis Selection Section. The widgets of each axis section are kept by axis letter, and the
+        # widgets hidden by zen mode are collected as they are made
         self.axis_section_layout = QVBoxLayout()
+        self.axis_sections = {}
+        self.zen_widgets = []
         axis_row_layout = QHBoxLayout()
 
         # X-Axis Dropdown and Inputs
@@ -1046,13 +1227,13 @@ class MizzouDataTool(QMainWindow):
         # Z-Axis Checkboxes
         self.use_z_axis_checkbox = QCheckBox("Use Z-Axis")
         self.use_z_axis_checkbox.stateChanged.connect(self.toggle_z_axis)
-        self.toggle_z_axis(False)
         self.apply_z_as_color_checkbox = QCheckBox("Apply Z-Axis as Color")
         self.extra_options_layout.addWidget(self.use_z_axis_checkbox)
         self.extra_options_layout.addWidget(self.apply_z_as_color_checkbox)
 
         self.preset_graphing_dropdown = QComboBox()
         self.preset_graphing_dropdown.setObjectName("preset_graphing_dropdown")
+        self.preset_rows = self.load_preset_rows()
         self.preset_graphs = self.get_preset_graphs()
         self.preset_graphing_dropdown.addItems(self.preset_graphs)
         self.preset_graphing_dropdown.currentIndexChanged.connect(self.execute_preset_graph)
@@ -1092,7 +1273,16 @@ class MizzouDataTool(QMainWindow):
         # Canvas Section for Plots
         canvas_layout = QVBoxLayout()
         self.canvas = MplCanvas(width=5, height=4, dpi=150)
+        self.plot_artists = None
+        self.plot_key = None
+        self.drawn_graph = None
+        self.graph_thread = None
+        self.graph_worker = None
+        self.graph_request = None
+        self.pending_graph = None
         self.array_window = []
+        self.save_preset_dialog = None
+        self.remove_preset_dialog = None
         self.toolbar = NavigationToolbar2QT(self.canvas, self)
         canvas_layout.addWidget(self.toolbar)
         canvas_layout.addWidget(self.canvas)
@@ -1140,11 +1330,24 @@ class MizzouDataTool(QMainWindow):
 
         main_layout.addLayout(self.specialty_item_layout)
 
-        # Initially disable all elements below file path input
+        self.zen_widgets += [self.extra_graph_buttons_dropdown, self.terminal_title, self.terminal, self.extra_features_title,
+                             self.swap_headers_label, self.swap_headers_dropdown_1, self.swap_headers_dropdown_2, self.swap_headers_button]
+
+        # Initially disable all elements below file path input, which includes the z-axis section
         self.set_elements_enabled(False)
         self.zen_mode_button.setEnabled(True)
         self.enter_zen_mode()
 
+        # Compile the numba loops in the background while the user picks their data
+        self.warm_up_thread = None
+        if njit is not None:
+            self.warm_up_thread = QThread()
+            self.warm_up_worker = Worker(warm_up_hold_steps)
+            self.warm_up_worker.moveToThread(self.warm_up_thread)
+            self.warm_up_thread.started.connect(self.warm_up_worker.run)
+            self.warm_up_worker.finished.connect(self.warm_up_thread.quit)
+            self.warm_up_thread.start()
+
     # Function which sets the title background
     def set_title_background_color(self, r, g, b):
         """
@@ -1156,6 +1359,15 @@ class MizzouDataTool(QMainWindow):
         self.title_label.setAutoFillBackground(True)
         self.title_label.setPalette(palette)
 
+    # Function which lights up a button given HIGHLIGHT_STYLE, or turns it back off. Nothing is done
+    # when the button is already in that state, as happens on every keystroke in the axis inputs
+    def set_highlighted(self, button, highlighted):
+        if button.property("highlighted") == highlighted:
+            return
+        button.setProperty("highlighted", highlighted)
+        button.style().unpolish(button)
+        button.style().polish(button)
+
     # Function to enable and disable elements, which is used for keeping the user from entering
     # values before data has been loaded
     def set_elements_enabled(self, enabled):
@@ -1170,14 +1382,20 @@ class MizzouDataTool(QMainWindow):
         self.toggle_children(self.extra_options_layout, enabled)
         self.toggle_children(self.graph_buttons_layout, enabled)
 
-    # Recursively disable child widgets
+    # Enable or disable every widget under a layout, walking nested layouts with a stack
     def toggle_children(self, layout, state):
-        for i in range(layout.count()):
-            widget = layout.itemAt(i).widget()
-            if widget:
-                widget.setEnabled(state)
-            elif isinstance(layout.itemAt(i), QVBoxLayout) or isinstance(layout.itemAt(i), QHBoxLayout) or isinstance(layout.itemAt(i), QGridLayout):
-                self.toggle_children(layout.itemAt(i), state)
+        layouts = [layout]
+        while layouts:
+            layout = layouts.pop()
+            for i in range(layout.count()):
+                item = layout.itemAt(i)
+                widget = item.widget()
+                if widget is not None:
+                    widget.setEnabled(state)
+                else:
+                    sub_layout = item.layout()
+                    if sub_layout is not None:
+                        layouts.append(sub_layout)
 
     # Function used to make the three axis sections
     def create_axis_section(self, axis_name):
@@ -1276,10 +1494,17 @@ class MizzouDataTool(QMainWindow):
 
         #Save Button
         save_button = QPushButton("SAVE SETTINGS")
+        save_button.setStyleSheet(HIGHLIGHT_STYLE)
         save_button.setObjectName("save_button_" + axis)
         save_button.clicked.connect(lambda: self.save_settings(axis))
         inputs_grid_layout.addWidget(save_button, 3, 0, 1, 6)
 
+        self.axis_sections[axis] = AxisSection(axis_dropdown, conversion_rate_input, unit_input, precision_input, range_low_input,
+                                               range_high_input, max_step_input, start_pos_input, save_button)
+        self.zen_widgets += [conversion_rate_label, conversion_rate_input, unit_label, unit_input, precision_label, precision_input,
+                             range_label, range_low_input, range_high_input, max_step_label, max_step_input,
+                             start_pos_label, start_pos_input, save_button]
+
         layout.addLayout(inputs_grid_layout)
         return layout
 
@@ -1292,9 +1517,9 @@ class MizzouDataTool(QMainWindow):
         if file_path:
             self.file_path_input.setText(file_path)
             self.log_message("Directory selected")
-            self.findChild(QWidget, "generate_df_button").setStyleSheet("background-color: #0BA87A")
+            self.set_highlighted(self.generate_df_button, True)
         else:
-            self.findChild(QWidget, "generate_df_button").setStyleSheet("background-color: none")
+            self.set_highlighted(self.generate_df_button, False)
             self.log_message("directory selection cancelled")
 
     # Function which opens a sub dialog for the user to select the path to a specific file
@@ -1306,9 +1531,9 @@ class MizzouDataTool(QMainWindow):
         if file_path:
             self.file_path_input.setText(file_path)
             self.log_message("File selected")
-            self.findChild(QWidget, "generate_df_button").setStyleSheet("background-color: #0BA87A")
+            self.set_highlighted(self.generate_df_button, True)
         else:
-            self.findChild(QWidget, "generate_df_button").setStyleSheet("background-color: none")
+            self.set_highlighted(self.generate_df_button, False)
             self.log_message("File selection cancelled")
 
     # Function which generates the data frame from the given path and enables all window functions
@@ -1331,18 +1556,21 @@ class MizzouDataTool(QMainWindow):
 
     # Helper function to generate all the data as a data frame
     def generate(self, is_dir):
-        self.findChild(QWidget, "generate_df_button").setStyleSheet("background-color: none")
+        self.set_highlighted(self.generate_df_button, False)
         self.data_frame = Dataframe()
         self.data_frame.parse_data(self.data_file_path, is_dir)
         self.set_elements_enabled(True)
-        self.toggle_z_axis(False)
+        # Unchecking the z-axis box would toggle the z-axis section again, so it is done without signals
+        self.use_z_axis_checkbox.blockSignals(True)
         self.use_z_axis_checkbox.setChecked(False)
+        self.use_z_axis_checkbox.blockSignals(False)
+        self.toggle_z_axis(False)
         self.log_message("Data Frame has been generated!")
         self.populate_axis_dropdowns(self.data_frame.headers)
         if os.path.exists(str(self.data_file_path) + '/MONOLITH.CSV'):
-            self.findChild(QWidget, "save_df_button").setStyleSheet("background-color: none")
+            self.set_highlighted(self.save_df_button, False)
         else:
-            self.findChild(QWidget, "save_df_button").setStyleSheet("background-color: #0BA87A")
+            self.set_highlighted(self.save_df_button, True)
 
     # Function to async log to the terminal after the save process
     def finished_save(self, result):
@@ -1358,17 +1586,17 @@ class MizzouDataTool(QMainWindow):
         """
         self.log_message("Saving data Frame please hold:")
 
-        self.findChild(QWidget, "save_df_button").setStyleSheet("background-color: none")
+        self.set_highlighted(self.save_df_button, False)
 
         self.thread = QThread()
 
-        self.worker = Worker()
+        self.worker = Worker(self.data_frame.save_data)
 
         self.worker.moveToThread(self.thread)
-        self.thread.started.connect(lambda: (self.worker.run(self.data_frame.save_data)))
+        self.thread.started.connect(self.worker.run)
         self.worker.finished.connect(self.thread.quit)
         self.worker.finished.connect(self.worker.deleteLater)
-        self.worker.finished.connect(lambda result: self.finished_save(result))
+        self.worker.finished.connect(self.finished_save)
         self.thread.finished.connect(self.thread.deleteLater)
         self.thread.start()
 
@@ -1393,17 +1621,19 @@ class MizzouDataTool(QMainWindow):
         """
         Populate all axis dropdown menus with keys from a dictionary.
         """
-        central_widget = self.findChild(QWidget, name = "central_widget")
-        x_axis_dropdown = central_widget.findChild(QWidget, "axis_dropdown_X")
-        y_axis_dropdown = central_widget.findChild(QWidget, "axis_dropdown_Y")
-        z_axis_dropdown = central_widget.findChild(QWidget, "axis_dropdown_Z")
-        swap_headers_dropdown_1 = central_widget.findChild(QWidget, "swap_headers_dropdown_1")
-        swap_headers_dropdown_2 = central_widget.findChild(QWidget, "swap_headers_dropdown_2")
-
-        for dropdown in [x_axis_dropdown, y_axis_dropdown, z_axis_dropdown,
-                            swap_headers_dropdown_1, swap_headers_dropdown_2]:
+        # Signals are blocked while filling so the axis inputs are refreshed once at the end,
+        # rather than on every change of the current index
+        options = list(options_dict.keys())
+        for dropdown in [self.axis_sections["X"].dropdown, self.axis_sections["Y"].dropdown, self.axis_sections["Z"].dropdown,
+                            self.swap_headers_dropdown_1, self.swap_headers_dropdown_2]:
+            dropdown.blockSignals(True)
             dropdown.clear()
-            dropdown.addItems(options_dict.keys())
+            dropdown.addItems(options)
+            dropdown.blockSignals(False)
+
+        self.update_axis_inputs("X")
+        self.update_axis_inputs("Y")
+        self.update_axis_inputs("Z")
     
     # Function to enable or disable the z-axis fields
     def toggle_z_axis(self, state):
@@ -1413,90 +1643,61 @@ class MizzouDataTool(QMainWindow):
     # Function to automatically update the axis input fields when a name is selected from the 
     # dropdown menu. These are pulled from the stored DataTypes.
     def update_axis_inputs(self, axis):
-        selected_item = self.findChild(QWidget, "axis_dropdown_" + axis).currentText()
+        section = self.axis_sections[axis]
+        selected_item = section.dropdown.currentText()
         if selected_item in self.data_frame.headers:
             data_type = self.data_frame.headers[selected_item]
-            central_widget = self.findChild(QWidget, name = "central_widget")
-
-            # Get the appropriate inputs based on their object names
-            conversion_rate_input = central_widget.findChild(QLineEdit, name = "conversion_rate_input_" + axis)  # Conversion Rate input (indexing is based on layout structure)
-            unit_input = central_widget.findChild(QLineEdit, name = "unit_input_" + axis)  # Unit input
-            precision_input = central_widget.findChild(QLineEdit, name = "precision_input_" + axis)  # Precision input
-            range_low_input = central_widget.findChild(QLineEdit, "range_low_input_" + axis)
-            range_high_input = central_widget.findChild(QLineEdit, "range_high_input_" + axis)
-            max_step_input = central_widget.findChild(QLineEdit, "max_step_input_" + axis)
-            start_pos_input = central_widget.findChild(QLineEdit, "start_pos_input_" + axis)            
-            
+
             # Update the text of the input fields
-            conversion_rate_input.setText(str(data_type.conv))
-            unit_input.setText(str(data_type.unit))
-            precision_input.setText(str(data_type.precision))
-            if data_type.range_low < -17000000000000000000: range_low_input.setText("")
-            else: range_low_input.setText(str(data_type.range_low))
-            if data_type.range_high > 17000000000000000000: range_high_input.setText("")
-            else: range_high_input.setText(str(data_type.range_high))
-            if data_type.max_step > 17000000000000000000: max_step_input.setText("")
-            else: max_step_input.setText(str(data_type.max_step))
-            if data_type.start_pos == 0: start_pos_input.setText("")
-            else: start_pos_input.setText(str(data_type.start_pos))
-
-            self.findChild(QWidget, "save_button_" + axis).setStyleSheet("background-color: none")
+            section.conversion_rate_input.setText(str(data_type.conv))
+            section.unit_input.setText(str(data_type.unit))
+            section.precision_input.setText(str(data_type.precision))
+            # Unset limits are the math.inf sentinel and are left blank
+            if math.isfinite(data_type.range_low): section.range_low_input.setText(str(data_type.range_low))
+            else: section.range_low_input.setText("")
+            if math.isfinite(data_type.range_high): section.range_high_input.setText(str(data_type.range_high))
+            else: section.range_high_input.setText("")
+            if math.isfinite(data_type.max_step): section.max_step_input.setText(str(data_type.max_step))
+            else: section.max_step_input.setText("")
+            if data_type.start_pos == 0: section.start_pos_input.setText("")
+            else: section.start_pos_input.setText(str(data_type.start_pos))
+
+            self.set_highlighted(section.save_button, False)
 
     # Function to set the color of the save button to alert the user to an unsaved change
     def update_save_color(self, axis):
-        self.findChild(QWidget, "save_button_" + axis).setStyleSheet("background-color: #0BA87A")
+        self.set_highlighted(self.axis_sections[axis].save_button, True)
 
     # Function which saves all of the input fields to the dataframe, including error and bounds
     # checking. If fields are left blank then the default values are used.
     def save_settings(self, axis):
-        central_widget = self.findChild(QWidget, name = "central_widget")
+        section = self.axis_sections[axis]
 
         # Get the header name from the dropdown text
-        dropdown = central_widget.findChild(QWidget, "axis_dropdown_" + axis)
-        selected_item = dropdown.currentText()
+        selected_item = section.dropdown.currentText()
 
         if selected_item in self.data_frame.headers:
-            # Get the appropriate inputs based on their object names
-            conversion_rate_input = central_widget.findChild(QWidget, name = "conversion_rate_input_" + axis)
-            unit_input = central_widget.findChild(QWidget, name = "unit_input_" + axis)
-            precision_input = central_widget.findChild(QWidget, name = "precision_input_" + axis)
-            range_low_input = central_widget.findChild(QWidget, name = "range_low_input_" + axis)
-            range_high_input = central_widget.findChild(QWidget, name = "range_high_input_" + axis)
-            max_step_input = central_widget.findChild(QWidget, name = "max_step_input_" + axis)
-            start_pos_input = central_widget.findChild(QWidget, name = "start_pos_input_" + axis)
-
-            # Get the texts of the inputs
-            conversion_rate_text = conversion_rate_input.text()
-            unit_text = unit_input.text()
-            precision_text = precision_input.text()
-            range_low_text = range_low_input.text()
-            range_high_text = range_high_input.text()
-            max_step_text = max_step_input.text()
-            start_pos_text = start_pos_input.text()
-
-            if conversion_rate_text == "": conversion_rate_text = 1
-            if unit_text == "": unit_text = "unknown"
-            if precision_text == "": precision_text = 1
-            if range_low_text == "": range_low_text = -18446744073709551615
-            if range_high_text == "": range_high_text = 18446744073709551615
-            if max_step_text == "": max_step_text = 18446744073709551615
-            if start_pos_text == "": start_pos_text = 0
+            # Read each input with the given conversion, falling back to the DataType default when it is blank
+            def read(input, default, convert = float):
+                text = input.text()
+                return convert(text) if text != "" else default
 
+            unit = read(section.unit_input, "unknown", str)
             try:
-                conversion_rate_text = float(conversion_rate_text)
-                precision_text = float(precision_text)
-                range_low_text = float(range_low_text)
-                range_high_text = float(range_high_text)
-                max_step_text = float(max_step_text)
-                start_pos_text = float(start_pos_text)
+                conversion_rate = read(section.conversion_rate_input, 1.0)
+                precision = read(section.precision_input, 1.0)
+                range_low = read(section.range_low_input, -math.inf, DataType.to_limit)
+                range_high = read(section.range_high_input, math.inf, DataType.to_limit)
+                max_step = read(section.max_step_input, math.inf, DataType.to_limit)
+                start_pos = read(section.start_pos_input, 0.0)
             except ValueError:
                 self.log_message("Invalid inputs, ensure that all are numbers")
                 return
 
-            self.data_frame.headers[selected_item].reinit(unit_text, conversion_rate_text, precision_text, range_low_text, range_high_text, max_step_text, start_pos_text)
+            self.data_frame.headers[selected_item].reinit(unit, conversion_rate, precision, range_low, range_high, max_step, start_pos)
 
-            self.findChild(QWidget, "save_button_" + axis).setStyleSheet("background-color: none")
-            self.findChild(QWidget, "save_df_button").setStyleSheet("background-color: #0BA87A")
+            self.set_highlighted(section.save_button, False)
+            self.set_highlighted(self.save_df_button, True)
 
             # Ensure that all other axes are updated, to prevent out-of-date issues
             self.update_axis_inputs("X")
@@ -1505,12 +1706,10 @@ class MizzouDataTool(QMainWindow):
 
     # Function to generate a graph into the canvas from all of the selected options and dropdowns
     def generate_graph(self, return_params):
-        central_widget = self.findChild(QWidget, name = "central_widget")
-
         # Get the axis selections
-        x_selection = central_widget.findChild(QWidget, "axis_dropdown_X").currentText()
-        y_selection = central_widget.findChild(QWidget, "axis_dropdown_Y").currentText()
-        z_selection = central_widget.findChild(QWidget, "axis_dropdown_Z").currentText()
+        x_selection = self.axis_sections["X"].dropdown.currentText()
+        y_selection = self.axis_sections["Y"].dropdown.currentText()
+        z_selection = self.axis_sections["Z"].dropdown.currentText()
 
         # Get all custom options
         z_enabled = self.use_z_axis_checkbox.isChecked()
@@ -1523,35 +1722,88 @@ class MizzouDataTool(QMainWindow):
         else:
             plot_title = y_selection + " vs. " + x_selection
 
-        self.canvas.figure.clear()
-
         if not z_enabled: plot_type = 0
         elif z_color: plot_type = 1
         else: plot_type = 2
 
         graph_style = self.graph_style
 
+        # The columns are handed over as the arrays the data frame already holds. Conditioning converts
+        # them into new float arrays, so the data frame itself is never changed by a graph
         x_dataType = self.data_frame.headers[x_selection]
-        x_data = [row[x_dataType.index] for row in self.data_frame.df]
+        x_data = self.data_frame.df[x_dataType.index]
         y_dataType = self.data_frame.headers[y_selection]
-        y_data = [row[y_dataType.index] for row in self.data_frame.df]
+        y_data = self.data_frame.df[y_dataType.index]
         z_dataType = self.data_frame.headers[z_selection]
-        z_data = [row[z_dataType.index] for row in self.data_frame.df]
+        z_data = self.data_frame.df[z_dataType.index]
 
         graph_object = GraphObject(plot_type, graph_style, x_data, x_dataType, y_data, y_dataType, z_data, z_dataType, [x_selection, y_selection, z_selection], plot_title)
 
+        if return_params:
+            return graph_object
+
+        # A plot of the same type and style only needs its artists and labels updated, even for other
+        # columns, as long as nothing else on the plot (trend lines, annotations, square limits) depends on the data
+        plot_key = (plot_type, graph_style)
+        data_independent_style = (graph_style.trend_line_type == "None" and not graph_style.enforce_square and
+                                  not (graph_style.show_min or graph_style.show_max or graph_style.show_stddev))
+
+        # The data is conditioned on a worker thread so the window stays responsive with large logs.
+        # While one graph is being prepared only the newest request waits to go next
+        self.pending_graph = (graph_object, plot_key, data_independent_style)
+        if self.graph_thread is None:
+            self.start_graph_thread()
+
+    # Function which starts conditioning the data of the pending graph on a worker thread. The
+    # result is handed to draw_graph back on the main thread
+    def start_graph_thread(self):
+        self.graph_request = self.pending_graph
+        self.pending_graph = None
+        graph_object = self.graph_request[0]
+
+        def prepare():
+            try:
+                if graph_object.plot_type == 0:
+                    return clean_data_2D(graph_object)
+                return clean_data_3D(graph_object, graph_object.plot_type == 2)
+            except Exception as e:
+                return e
+
+        self.graph_thread = QThread()
+        self.graph_worker = Worker(prepare)
+        self.graph_worker.moveToThread(self.graph_thread)
+        self.graph_thread.started.connect(self.graph_worker.run)
+        self.graph_worker.finished.connect(self.graph_thread.quit)
+        self.graph_worker.finished.connect(self.draw_graph)
+        self.graph_thread.finished.connect(self.finished_graph_thread)
+        self.graph_thread.start()
+
+    # Function which draws the graph that was just prepared into the canvas. It is skipped if a newer
+    # graph was requested in the meantime or the graph was cleared
+    def draw_graph(self, plot_data):
+        if self.graph_request is None or self.pending_graph is not None:
+            return
+        graph_object, plot_key, data_independent_style = self.graph_request
+        self.graph_request = None
+
         figure = self.canvas.figure
+        self.drawn_graph = None
         try:
-            if not return_params:
-                if plot_type == 0:
-                    make_plot_2D(figure, graph_object)
-                elif plot_type == 1:
-                    make_plot_3D_color(figure, graph_object)
-                else:
-                    make_plot_3D(figure, graph_object)
-                self.canvas.draw()
+            if isinstance(plot_data, Exception):
+                raise plot_data
+            # Autoscaling keeps the old limits when there is no data, so an empty plot is always rebuilt
+            if plot_key == self.plot_key and data_independent_style and len(plot_data[0]) > 0:
+                UPDATE_FUNCTIONS[graph_object.plot_type](self.plot_artists, graph_object, plot_data)
+                # The zoom and pan history belongs to the old data
+                self.toolbar.update()
             else:
-                return graph_object
+                self.plot_key = None
+                figure.clear()
+                self.plot_artists = make_plot(figure, graph_object, plot_data)
+                self.plot_key = plot_key
+            self.canvas.draw_idle()
+            # The graph object is kept with its signature so the ids in it stay unique
+            self.drawn_graph = (graph_object, graph_object.data_signature(), plot_data)
         except Exception as e:
             err_type = type(e).__name__
             if err_type == "TypeError":
@@ -1563,22 +1815,47 @@ class MizzouDataTool(QMainWindow):
                 if self.zen:
                         self.show_error_dialog("Encountered an unexpected error when attempting to graph.")
 
+    # Function which lets go of the finished graph thread, and starts on the next graph if one was
+    # requested while it ran
+    def finished_graph_thread(self):
+        self.graph_thread.wait()
+        self.graph_thread = None
+        self.graph_worker = None
+        if self.pending_graph is not None:
+            self.start_graph_thread()
+
     # Function to pop out a full screen window with the currently selected graph options. This
     # window will behave as a fully independant graph, and can be translated and rescaled
     def full_screen_figure(self):
         w = BreakoutWindow()
         graph_object = self.generate_graph(True)
-        w.fullscreen_graph(graph_object)
+        # The data already conditioned for the main canvas is reused when it is the same graph
+        plot_data = None
+        if self.drawn_graph is not None and self.drawn_graph[1] == graph_object.data_signature():
+            plot_data = self.drawn_graph[2]
+        w.fullscreen_graph(graph_object, plot_data)
+        self.show_breakout_window(w)
+
+    # Function which shows a breakout window and keeps a reference to it in array_window while it is
+    # open. The window is deleted by Qt when closed, which drops it from the list along with its graph.
+    # The slot only holds the window's id, as holding the window itself would keep it alive
+    def show_breakout_window(self, w):
+        window_id = id(w)
+        w.destroyed.connect(lambda: self.forget_breakout_window(window_id))
         w.show_new_window()
         self.array_window.append(w)
 
-    # Function to save a graph as a .MRGO bytestream. Uses docs.python.org/3/library/pickle.html
+    # Function which drops a closed breakout window from array_window
+    def forget_breakout_window(self, window_id):
+        self.array_window = [window for window in self.array_window if id(window) != window_id]
+
+    # Function to save a graph as a .MRGO file, which is a numpy archive written by GraphObject.save
     def save_graph(self):
         try:
             graph_object = self.generate_graph(True)
             name, ft = QFileDialog.getSaveFileName(self, "Save :)", "./","Mizzou Racing Graph Object (*.MRGO)")
             with open(name, 'wb') as file:
-                pickle.dump(graph_object, file)
+                graph_object.save(file)
         except Exception as e:
             self.log_message("Save Graph Cancelled or incorrect file was used")
             self.log_message(str(e))
@@ -1588,13 +1865,11 @@ class MizzouDataTool(QMainWindow):
         try:
             path = QFileDialog.getOpenFileName(self, "Select File")
             
-            with open(path[0], 'rb') as file:
-                pickled_object = pickle.load(file)
+            graph_object = GraphObject.load(path[0])
 
             w = BreakoutWindow()
-            w.fullscreen_graph(pickled_object)
-            w.show_new_window()
-            self.array_window.append(w)
+            w.fullscreen_graph(graph_object)
+            self.show_breakout_window(w)
 
         except Exception as e:
             self.log_message("Open Graph Cancelled or incorrect file was used")
@@ -1602,6 +1877,10 @@ class MizzouDataTool(QMainWindow):
 
     # Function which clears the canvas of all graphs
     def clear_graph(self):
+        self.plot_key = None
+        self.drawn_graph = None
+        self.graph_request = None
+        self.pending_graph = None
         self.canvas.figure.clear()
         self.canvas.draw()
 
@@ -1612,35 +1891,37 @@ class MizzouDataTool(QMainWindow):
         self.extra_graph_options[self.extra_graph_buttons_dropdown.currentText()]()
         self.extra_graph_buttons_dropdown.setCurrentIndex(0)
 
-    # Function which searches for and loads up options from the PRESETS.CSV file. This is intended
-    # to allow the user to store commonly used graph setups as "presets". For example, the course
-    # map graphing setup is by default kept in the PRESETS.CSV, as this will be commonly used
+    # Function which reads the PRESETS.CSV file once into a dictionary of rows keyed by preset name.
+    # This is intended to allow the user to store commonly used graph setups as "presets". For example,
+    # the course map graphing setup is by default kept in the PRESETS.CSV, as this will be commonly used.
+    # The dictionary is kept up to date by the save and remove functions so the file is not read again
+    def load_preset_rows(self):
+        preset_rows = {}
+        # The terminal does not exist yet when this is called, so a missing file is just recreated empty
+        if not os.path.exists("./PRESETS.CSV"):
+            with open("./PRESETS.CSV", "w") as preset_file:
+                preset_file.write("name,x_selection,y_selection,z_selection,use_z_axis,use_z_axis_as_color\n")
+            return preset_rows
+        with open("./PRESETS.CSV", "r", newline="") as preset_file:
+            reader = csv.reader(preset_file)
+            # Strip headers (these only exist for user convenience)
+            next(reader, None)
+            for row in reader:
+                if len(row) >= 6:
+                    preset_rows[row[0]] = row
+        return preset_rows
+
+    # Function which lists the preset names for the preset dropdown
     def get_preset_graphs(self):
-        ret_list = []
-        ret_list.append("Load Preset Graph")
-        with open("./PRESETS.CSV", "r") as preset_file:
-            if not preset_file:
-                self.log_message("Error: no presets file found")
-                with open("./PRESETS.CSV", "w") as preset_file:
-                    preset_file.write("name,x_selection,y_selection,z_selection,use_z_axis,use_z_axis_as_color")
-            else:
-                # Strip headers (these only exist for user convenience)
-                preset_file.readline().rstrip().split(",")
-                while True:
-                    line = preset_file.readline()
-                    if not line:
-                        break
-                    line = line.rstrip().split(",")
-                    ret_list.append(line[0])
-        return ret_list
+        return ["Load Preset Graph", *self.preset_rows.keys()]
 
     # Function which graphs from the preset graphs by setting the dropdown menus and calling the
     # standard graphing function
     def populate_preset_graph(self, x_sel, y_sel, z_sel, use_z, z_as_color):
         if x_sel in self.data_frame.headers and y_sel in self.data_frame.headers and z_sel in self.data_frame.headers:
-            self.findChild(QWidget, "axis_dropdown_X").setCurrentIndex(self.data_frame.headers[x_sel].index)
-            self.findChild(QWidget, "axis_dropdown_Y").setCurrentIndex(self.data_frame.headers[y_sel].index)
-            self.findChild(QWidget, "axis_dropdown_Z").setCurrentIndex(self.data_frame.headers[z_sel].index)
+            self.axis_sections["X"].dropdown.setCurrentIndex(self.data_frame.headers[x_sel].index)
+            self.axis_sections["Y"].dropdown.setCurrentIndex(self.data_frame.headers[y_sel].index)
+            self.axis_sections["Z"].dropdown.setCurrentIndex(self.data_frame.headers[z_sel].index)
             self.use_z_axis_checkbox.setChecked(use_z)
             self.apply_z_as_color_checkbox.setChecked(z_as_color)
             self.generate_graph(False)
@@ -1651,33 +1932,30 @@ class MizzouDataTool(QMainWindow):
     # and then makes a call to graph that preset option.
     def execute_preset_graph(self):
         if self.preset_graphing_dropdown.currentIndex() == 0: return
-        selection = self.preset_graphing_dropdown.currentText()
-        with open("./PRESETS.CSV", "r") as preset_file:
-            # Strip headers (these only exist for user convenience)
-            preset_file.readline().rstrip().split(",")
-            while True:
-                line = preset_file.readline()
-                if not line:
-                    break
-                line = line.rstrip().split(",")
-                if line[0] == selection:
-                    self.populate_preset_graph(x_sel=line[1], y_sel=line[2], z_sel=line[3], use_z= line[4]=="True", z_as_color= line[5]=="True")
+        row = self.preset_rows.get(self.preset_graphing_dropdown.currentText())
+        if row is not None:
+            self.populate_preset_graph(x_sel=row[1], y_sel=row[2], z_sel=row[3], use_z= row[4]=="True", z_as_color= row[5]=="True")
         self.preset_graphing_dropdown.setCurrentIndex(0)
 
     # Function which saves the current graph options as a preset to the PRESETS.CSV file
     def save_preset_graph(self):
-        save_preset_dialog = SavePresetPopoutWindow(self)
-        if save_preset_dialog.exec() == QDialog.DialogCode.Accepted:
-            preset_name = save_preset_dialog.get_name()
-
-            with open("./PRESETS.CSV", "a") as presets_file:
-                x_sel = self.findChild(QWidget, "axis_dropdown_X").currentText()
-                y_sel = self.findChild(QWidget, "axis_dropdown_Y").currentText()
-                z_sel = self.findChild(QWidget, "axis_dropdown_Z").currentText()
-                use_z = self.use_z_axis_checkbox.isChecked()
-                z_as_color = self.apply_z_as_color_checkbox.isChecked()
-                line = ",".join([preset_name, x_sel, y_sel, z_sel, str(use_z), str(z_as_color)]) + "\n"
-                presets_file.write(line)
+        # The dialog is made once and cleared for each later save
+        if self.save_preset_dialog is None:
+            self.save_preset_dialog = SavePresetPopoutWindow(self)
+        else:
+            self.save_preset_dialog.reset()
+        if self.save_preset_dialog.exec() == QDialog.DialogCode.Accepted:
+            preset_name = self.save_preset_dialog.get_name()
+
+            x_sel = self.axis_sections["X"].dropdown.currentText()
+            y_sel = self.axis_sections["Y"].dropdown.currentText()
+            z_sel = self.axis_sections["Z"].dropdown.currentText()
+            use_z = self.use_z_axis_checkbox.isChecked()
+            z_as_color = self.apply_z_as_color_checkbox.isChecked()
+            row = [preset_name, x_sel, y_sel, z_sel, str(use_z), str(z_as_color)]
+            with open("./PRESETS.CSV", "a", newline="") as presets_file:
+                csv.writer(presets_file, lineterminator="\n").writerow(row)
+            self.preset_rows[preset_name] = row
             self.log_message("Preset sucesssfully saved!")
             self.preset_graphs = self.get_preset_graphs()
             self.preset_graphing_dropdown.clear()
@@ -1686,15 +1964,23 @@ class MizzouDataTool(QMainWindow):
     # Function to remove a preset from the csv of presets. This is done via a popout dialog
     # with a dropdown of the presets which can be selected for removal
     def remove_preset_graph(self):
-        remove_preset_dialog = RemovePresetPopoutWindow(self.preset_graphs, self)
-        if remove_preset_dialog.exec() == QDialog.DialogCode.Accepted:
-            preset_name = remove_preset_dialog.get_name()
-            with open("./PRESETS.CSV", "r") as presets_file:
-                presets = presets_file.readlines()
-            with open("./PRESETS.CSV", "w") as presets_file:
-                for preset in presets:
-                    if preset.rstrip().split(",")[0] != preset_name:
-                        presets_file.write(preset)
+        # The dialog is made once and given the current presets for each later removal
+        if self.remove_preset_dialog is None:
+            self.remove_preset_dialog = RemovePresetPopoutWindow(self.preset_graphs, self)
+        else:
+            self.remove_preset_dialog.reset(self.preset_graphs)
+        if self.remove_preset_dialog.exec() == QDialog.DialogCode.Accepted:
+            preset_name = self.remove_preset_dialog.get_name()
+            # The other rows are copied as they are into a temporary file, which then replaces the presets
+            # file in one step so a failed write cannot leave it half written
+            with open("./PRESETS.CSV", "r", newline="") as presets_file, \
+                    tempfile.NamedTemporaryFile("w", delete=False, newline="", dir=".") as new_presets_file:
+                writer = csv.writer(new_presets_file, lineterminator="\n")
+                for row in csv.reader(presets_file):
+                    if not row or row[0] != preset_name:
+                        writer.writerow(row)
+            os.replace(new_presets_file.name, "./PRESETS.CSV")
+            self.preset_rows.pop(preset_name, None)
 
             self.log_message("Preset sucesssfully removed!")
 
@@ -1711,9 +1997,8 @@ class MizzouDataTool(QMainWindow):
     # labeled incorrectly. We have found this to be an issue with IMU data specifically due to
     # changes in mounting and orientation
     def swap_headers(self):
-        central_widget = self.findChild(QWidget, "central_widget")
-        header_1 = central_widget.findChild(QWidget, "swap_headers_dropdown_1").currentText()
-        header_2 = central_widget.findChild(QWidget, "swap_headers_dropdown_2").currentText()
+        header_1 = self.swap_headers_dropdown_1.currentText()
+        header_2 = self.swap_headers_dropdown_2.currentText()
         if header_1 == header_2:
             self.log_message("Error: Cannot swap from same labels")
             return
@@ -1730,128 +2015,25 @@ class MizzouDataTool(QMainWindow):
     # the user's view. Note that these widgets still exist in this state and are interacted with by
     # the program, but cannot be seen until zen mode is toggled off, also with this function
     def enter_zen_mode(self):
-        central_widget = self.findChild(QWidget, "central_widget")
         self.zen = not self.zen
-        if self.zen:
-            central_widget.findChild(QWidget, "conversion_rate_label_X").hide()
-            central_widget.findChild(QWidget, "conversion_rate_label_Y").hide()
-            central_widget.findChild(QWidget, "conversion_rate_label_Z").hide()
-            central_widget.findChild(QWidget, "conversion_rate_input_X").hide()
-            central_widget.findChild(QWidget, "conversion_rate_input_Y").hide()
-            central_widget.findChild(QWidget, "conversion_rate_input_Z").hide()
-            central_widget.findChild(QWidget, "unit_label_X").hide()
-            central_widget.findChild(QWidget, "unit_label_Y").hide()
-            central_widget.findChild(QWidget, "unit_label_Z").hide()
-            central_widget.findChild(QWidget, "unit_input_X").hide()
-            central_widget.findChild(QWidget, "unit_input_Y").hide()
-            central_widget.findChild(QWidget, "unit_input_Z").hide()
-            central_widget.findChild(QWidget, "precision_label_X").hide()
-            central_widget.findChild(QWidget, "precision_label_Y").hide()
-            central_widget.findChild(QWidget, "precision_label_Z").hide()
-            central_widget.findChild(QWidget, "precision_input_X").hide()
-            central_widget.findChild(QWidget, "precision_input_Y").hide()
-            central_widget.findChild(QWidget, "precision_input_Z").hide()
-            central_widget.findChild(QWidget, "range_label_X").hide()
-            central_widget.findChild(QWidget, "range_label_Y").hide()
-            central_widget.findChild(QWidget, "range_label_Z").hide()
-            central_widget.findChild(QWidget, "range_low_input_X").hide()
-            central_widget.findChild(QWidget, "range_low_input_Y").hide()
-            central_widget.findChild(QWidget, "range_low_input_Z").hide()
-            central_widget.findChild(QWidget, "range_high_input_X").hide()
-            central_widget.findChild(QWidget, "range_high_input_Y").hide()
-            central_widget.findChild(QWidget, "range_high_input_Z").hide()
-            central_widget.findChild(QWidget, "max_step_label_X").hide()
-            central_widget.findChild(QWidget, "max_step_label_Y").hide()
-            central_widget.findChild(QWidget, "max_step_label_Z").hide()
-            central_widget.findChild(QWidget, "max_step_input_X").hide()
-            central_widget.findChild(QWidget, "max_step_input_Y").hide()
-            central_widget.findChild(QWidget, "max_step_input_Z").hide()
-            central_widget.findChild(QWidget, "start_pos_label_X").hide()
-            central_widget.findChild(QWidget, "start_pos_label_Y").hide()
-            central_widget.findChild(QWidget, "start_pos_label_Z").hide()
-            central_widget.findChild(QWidget, "start_pos_input_X").hide()
-            central_widget.findChild(QWidget, "start_pos_input_Y").hide()
-            central_widget.findChild(QWidget, "start_pos_input_Z").hide()
-            central_widget.findChild(QWidget, "save_button_X").hide()
-            central_widget.findChild(QWidget, "save_button_Y").hide()
-            central_widget.findChild(QWidget, "save_button_Z").hide()
-
-            self.extra_graph_buttons_dropdown.hide()
-
-            self.terminal_title.hide()
-            self.terminal.hide()
-
-            self.extra_features_title.hide()
-            self.swap_headers_label.hide()
-            self.swap_headers_dropdown_1.hide()
-            self.swap_headers_dropdown_2.hide()
-            self.swap_headers_button.hide()
-
-        else:
-            central_widget.findChild(QWidget, "conversion_rate_label_X").show()
-            central_widget.findChild(QWidget, "conversion_rate_label_Y").show()
-            central_widget.findChild(QWidget, "conversion_rate_label_Z").show()
-            central_widget.findChild(QWidget, "conversion_rate_input_X").show()
-            central_widget.findChild(QWidget, "conversion_rate_input_Y").show()
-            central_widget.findChild(QWidget, "conversion_rate_input_Z").show()
-            central_widget.findChild(QWidget, "unit_label_X").show()
-            central_widget.findChild(QWidget, "unit_label_Y").show()
-            central_widget.findChild(QWidget, "unit_label_Z").show()
-            central_widget.findChild(QWidget, "unit_input_X").show()
-            central_widget.findChild(QWidget, "unit_input_Y").show()
-            central_widget.findChild(QWidget, "unit_input_Z").show()
-            central_widget.findChild(QWidget, "precision_label_X").show()
-            central_widget.findChild(QWidget, "precision_label_Y").show()
-            central_widget.findChild(QWidget, "precision_label_Z").show()
-            central_widget.findChild(QWidget, "precision_input_X").show()
-            central_widget.findChild(QWidget, "precision_input_Y").show()
-            central_widget.findChild(QWidget, "precision_input_Z").show()
-            central_widget.findChild(QWidget, "range_label_X").show()
-            central_widget.findChild(QWidget, "range_label_Y").show()
-            central_widget.findChild(QWidget, "range_label_Z").show()
-            central_widget.findChild(QWidget, "range_low_input_X").show()
-            central_widget.findChild(QWidget, "range_low_input_Y").show()
-            central_widget.findChild(QWidget, "range_low_input_Z").show()
-            central_widget.findChild(QWidget, "range_high_input_X").show()
-            central_widget.findChild(QWidget, "range_high_input_Y").show()
-            central_widget.findChild(QWidget, "range_high_input_Z").show()
-            central_widget.findChild(QWidget, "max_step_label_X").show()
-            central_widget.findChild(QWidget, "max_step_label_Y").show()
-            central_widget.findChild(QWidget, "max_step_label_Z").show()
-            central_widget.findChild(QWidget, "max_step_input_X").show()
-            central_widget.findChild(QWidget, "max_step_input_Y").show()
-            central_widget.findChild(QWidget, "max_step_input_Z").show()
-            central_widget.findChild(QWidget, "start_pos_label_X").show()
-            central_widget.findChild(QWidget, "start_pos_label_Y").show()
-            central_widget.findChild(QWidget, "start_pos_label_Z").show()
-            central_widget.findChild(QWidget, "start_pos_input_X").show()
-            central_widget.findChild(QWidget, "start_pos_input_Y").show()
-            central_widget.findChild(QWidget, "start_pos_input_Z").show()
-            central_widget.findChild(QWidget, "save_button_X").show()
-            central_widget.findChild(QWidget, "save_button_Y").show()
-            central_widget.findChild(QWidget, "save_button_Z").show()
-
-            self.extra_graph_buttons_dropdown.show()
-
-            self.terminal_title.show()
-            self.terminal.show()
-
-            self.extra_features_title.show()
-            self.swap_headers_label.show()
-            self.swap_headers_dropdown_1.show()
-            self.swap_headers_dropdown_2.show()
-            self.swap_headers_button.show()
+        # Repaints are held off while the widgets are toggled, so the window is redrawn once at the end
+        central_widget = self.centralWidget()
+        central_widget.setUpdatesEnabled(False)
+        try:
+            for widget in self.zen_widgets:
+                widget.setVisible(not self.zen)
+        finally:
+            central_widget.setUpdatesEnabled(True)
 
     # Function to implement the "I'm Feelin Lucky" button. This is purely for fun, and makes a 
     # random graph of the 3D with color variety (chosen because that's the coolest looking one)
     def up_all_night(self):
-        central_widget = self.findChild(QWidget, "central_widget")
-        x_axis_dropdown = central_widget.findChild(QWidget, "axis_dropdown_X")
-        y_axis_dropdown = central_widget.findChild(QWidget, "axis_dropdown_Y")
-        z_axis_dropdown = central_widget.findChild(QWidget, "axis_dropdown_Z")
-        x_axis_dropdown.setCurrentIndex(random.randint(0, x_axis_dropdown.count()-1))
-        y_axis_dropdown.setCurrentIndex(random.randint(0, y_axis_dropdown.count()-1))
-        z_axis_dropdown.setCurrentIndex(random.randint(0, z_axis_dropdown.count()))
+        x_axis_dropdown = self.axis_sections["X"].dropdown
+        y_axis_dropdown = self.axis_sections["Y"].dropdown
+        z_axis_dropdown = self.axis_sections["Z"].dropdown
+        x_axis_dropdown.setCurrentIndex(random.randrange(x_axis_dropdown.count()))
+        y_axis_dropdown.setCurrentIndex(random.randrange(y_axis_dropdown.count()))
+        z_axis_dropdown.setCurrentIndex(random.randrange(z_axis_dropdown.count()))
         self.use_z_axis_checkbox.setChecked(True)
         self.apply_z_as_color_checkbox.setChecked(True)
         self.generate_graph(False)
@@ -1868,26 +2050,35 @@ class BreakoutWindow(QMainWindow):
         central_widget.setLayout(main_layout)
         central_widget.setObjectName("central_widget")
         self.setCentralWidget(central_widget)
-
-        # Make a dataframe object just for graphing
-        self.data_frame = Dataframe()
-
-        # Canvas Section for Plots
-        self.canvas = MplCanvas(width=5, height=4, dpi=200)
+        self.main_layout = main_layout
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        # Canvas Section for Plots. The canvas is made when there is something to graph, at the size
+        # of the screen the window is maximized on, so it is not drawn and then resized straight away
+        self.canvas = None
+        self.toolbar = None
+
+    # Function which makes the canvas and its toolbar, sized to fill the available screen
+    def create_canvas(self):
+        dpi = 200
+        screen_size = self.screen().availableGeometry()
+        self.canvas = MplCanvas(width=screen_size.width() / dpi, height=screen_size.height() / dpi, dpi=dpi)
         self.toolbar = NavigationToolbar2QT(self.canvas, self)
-        main_layout.addWidget(self.toolbar) 
-        main_layout.addWidget(self.canvas)
-        
+        self.main_layout.addWidget(self.toolbar)
+        self.main_layout.addWidget(self.canvas)
+
     # Main function of the window, which accepts the data from the calling window and plots it
-    def fullscreen_graph(self, graph_object):
+    # plot_data can be given the already conditioned data of the graph object
+    def fullscreen_graph(self, graph_object, plot_data = None):
+        if self.canvas is None:
+            self.create_canvas()
         self.canvas.figure.clear()
         figure = self.canvas.figure
 
-        if graph_object.plot_type == 0: make_plot_2D(figure, graph_object)
-        elif graph_object.plot_type == 1: make_plot_3D_color(figure, graph_object)
-        else: make_plot_3D(figure, graph_object)
+        make_plot(figure, graph_object, plot_data)
 
-        self.canvas.draw()
+        # Drawn once the window has been shown at its final size
+        self.canvas.draw_idle()
 
     # Function to call window as fullscreen popup
     def show_new_window(self):
@@ -1917,6 +2108,12 @@ class SavePresetPopoutWindow(QDialog):
         # Connect button signal
         self.confirm_button.clicked.connect(self.accept)
 
+    def reset(self):
+        """Clear the entered name and center the dialog on its parent again before reuse."""
+        parent = self.parentWidget()
+        self.setGeometry(parent.x() + parent.width()//2 - 150, parent.y() + parent.height()//2 - 50, 300, 100)
+        self.preset_name_input.clear()
+
     def get_name(self):
         """Return the entered text when dialog is accepted."""
         return self.preset_name_input.text()
@@ -1932,8 +2129,7 @@ class RemovePresetPopoutWindow(QDialog):
         # Layout and widgets
         self.layout = QVBoxLayout()
         self.preset_name_dropdown = QComboBox()
-        self.preset_name_dropdown.addItems(names)
-        self.preset_name_dropdown.setItemText(0, "Remove Preset Graph")
+        self.set_names(names)
         self.confirm_button = QPushButton("Remove")
 
         # Add widgets to layout
@@ -1944,6 +2140,18 @@ class RemovePresetPopoutWindow(QDialog):
         # Connect button signal
         self.confirm_button.clicked.connect(self.accept)
 
+    def set_names(self, names):
+        """Fill the dropdown with the preset names, the first entry being the placeholder."""
+        self.preset_name_dropdown.clear()
+        self.preset_name_dropdown.addItems(names)
+        self.preset_name_dropdown.setItemText(0, "Remove Preset Graph")
+
+    def reset(self, names):
+        """Refill the presets and center the dialog on its parent again before reuse."""
+        parent = self.parentWidget()
+        self.setGeometry(parent.x() + parent.width()//2 - 150, parent.y() + parent.height()//2 - 50, 300, 100)
+        self.set_names(names)
+
     def get_name(self):
         """Return the entered text when dialog is accepted."""
         return self.preset_name_dropdown.currentText()